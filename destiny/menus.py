@@ -1,7 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from functools import cached_property
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import discord
 from red_commons.logging import getLogger
@@ -127,19 +141,76 @@ class ClanPendingView(discord.ui.View):
         self.message = await self.ctx.send(embed=embed, view=self)
 
 
+@dataclass
+class ItemView:
+    name: str
+    icon_url: Optional[str] = None
+    screenshot_url: Optional[str] = None
+
+    @classmethod
+    def from_definition(cls, data: dict) -> ItemView:
+        display = data.get("displayProperties", {})
+        icon = display.get("icon")
+        screenshot = data.get("screenshot")
+        return cls(
+            name=display.get("name", "None"),
+            icon_url=BASE_URL + icon if icon else None,
+            screenshot_url=BASE_URL + screenshot if screenshot else None,
+        )
+
+
+class LazySelectOptions(Sequence[discord.SelectOption]):
+    """A sequence of SelectOption's that are only built when accessed
+
+    Menus only ever display 25 options at a time so there's no need to
+    build one for every page up front.
+    """
+
+    def __init__(self, length: int, factory: Callable[[int], discord.SelectOption]):
+        self._length = length
+        self._factory = factory
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[discord.SelectOption, List[discord.SelectOption]]:
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                return [self._factory(i) for i in range(*index.indices(self._length))]
+            return list(self.window(index.start, index.stop))
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("select option index out of range")
+        return self._factory(index)
+
+    def window(
+        self, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Iterator[discord.SelectOption]:
+        """Yield only the options between start and end"""
+        for i in range(*slice(start, end).indices(self._length)):
+            yield self._factory(i)
+
+
 class BasePages(menus.ListPageSource):
     def __init__(self, pages: list, use_author: bool = False):
         super().__init__(pages, per_page=1)
         self.pages = pages
-        self.select_options = []
-        for count, page in enumerate(pages):
-            self.select_options.append(
-                discord.SelectOption(
-                    label=_("Page {number}").format(number=count + 1),
-                    value=count,
-                    description=page.title[:50] if not use_author else page.author.name[:50],
-                )
-            )
+        self.use_author = use_author
+
+    @cached_property
+    def select_options(self) -> LazySelectOptions:
+        return LazySelectOptions(len(self.pages), self._make_option)
+
+    def _make_option(self, count: int) -> discord.SelectOption:
+        page = self.pages[count]
+        return discord.SelectOption(
+            label=_("Page {number}").format(number=count + 1),
+            value=count,
+            description=page.title[:50] if not self.use_author else page.author.name[:50],
+        )
 
     def is_paginating(self):
         return True
@@ -153,46 +224,134 @@ class VaultPages(menus.ListPageSource):
     def __init__(self, pages: list, cog: commands.Cog):
         super().__init__(pages, per_page=1)
         self.pages = pages
-        self.select_options = []
         self.cog = cog
         self.current_item_hash = None
         self.current_item_instance = None
-
-        for count, page in enumerate(pages):
-            self.select_options.append(
-                discord.SelectOption(
-                    label=_("Page {number}").format(number=count + 1),
-                    value=count,
-                    description="figure out how to get the gun name here",
-                )
-            )
+        self._def_cache: Dict[Tuple[str, int], dict] = {}
+        self._def_locks: Dict[Tuple[str, int], asyncio.Lock] = {}
+        self._instance_cache: Dict[str, dict] = {}
+        self._instance_locks: Dict[str, asyncio.Lock] = {}
+        self._item_views: Dict[int, ItemView] = {}
+        self._perk_names: Dict[int, str] = {}
+        self._preload_task: Optional[asyncio.Task] = None
+
+    @cached_property
+    def select_options(self) -> LazySelectOptions:
+        return LazySelectOptions(len(self.pages), self._make_option)
+
+    def _make_option(self, count: int) -> discord.SelectOption:
+        # Use the item name if we've already looked up this items definition
+        item_hash = int(self.pages[count]["itemHash"])
+        item_data = self._def_cache.get(("DestinyInventoryItemDefinition", item_hash), {})
+        name = item_data.get("displayProperties", {}).get("name")
+        return discord.SelectOption(
+            label=_("Page {number}").format(number=count + 1),
+            value=count,
+            description=name[:50] if name else None,
+        )
 
     def is_paginating(self):
         return True
 
+    async def _defs(self, entity: str, hashes: list) -> dict:
+        """Get definitions for the provided hashes only looking up the ones
+        we haven't already seen during this menu session.
+        """
+        misses = sorted({int(h) for h in hashes if (entity, int(h)) not in self._def_cache})
+        if misses and self._preload_task is not None and not self._preload_task.done():
+            # Wait for the preload rather than parsing the manifest a second time alongside it
+            await asyncio.wait({self._preload_task})
+            misses = [h for h in misses if (entity, h) not in self._def_cache]
+        if misses:
+            # acquire in sorted order so overlapping lookups can't deadlock
+            locks = [self._def_locks.setdefault((entity, h), asyncio.Lock()) for h in misses]
+            for lock in locks:
+                await lock.acquire()
+            try:
+                misses = [h for h in misses if (entity, h) not in self._def_cache]
+                if misses:
+                    data = await self.cog.get_definition(entity, misses)
+                    for key, value in data.items():
+                        self._def_cache[(entity, int(key))] = value
+            finally:
+                for lock in locks:
+                    lock.release()
+        return {
+            str(h): self._def_cache[(entity, int(h))]
+            for h in hashes
+            if (entity, int(h)) in self._def_cache
+        }
+
+    def start_preload(self) -> asyncio.Task:
+        """Start loading the vault item definitions in the background"""
+        if self._preload_task is None:
+            self._preload_task = asyncio.create_task(self.preload_definitions())
+        return self._preload_task
+
+    async def preload_definitions(self):
+        """Load the definitions for every item in the vault in one pass from the manifest"""
+        entity = "DestinyInventoryItemDefinition"
+        try:
+            data = await self.cog.get_entities(entity)
+        except Exception:
+            # Without the manifest every definition is its own API request
+            # so leave them to be looked up as the pages are shown
+            return
+        for page in self.pages:
+            item_hash = str(page["itemHash"])
+            if item_hash in data:
+                self._def_cache.setdefault((entity, int(item_hash)), data[item_hash])
+
+    async def _instance(self, author: discord.abc.User, instance_id: str) -> dict:
+        if instance_id not in self._instance_cache:
+            # share the request with a prefetch that is already looking this item up
+            async with self._instance_locks.setdefault(instance_id, asyncio.Lock()):
+                if instance_id not in self._instance_cache:
+                    data = await self.cog.get_instanced_item(author, instance_id)
+                    self._instance_cache[instance_id] = data
+        return self._instance_cache[instance_id]
+
+    async def _fetch_page_data(
+        self, author: discord.abc.User, page: dict
+    ) -> Tuple[dict, Optional[dict]]:
+        item_hash = page["itemHash"]
+        instance_id = page.get("itemInstanceId", None)
+        coros = [self._defs("DestinyInventoryItemDefinition", [item_hash])]
+        if instance_id is not None:
+            coros.append(self._instance(author, instance_id))
+        items, *instance = await asyncio.gather(*coros)
+        return items, instance[0] if instance else None
+
+    async def prefetch(self, menu: BaseMenu, page: dict):
+        """Warm the definition caches for a page without building the embed"""
+        _items, instance_data = await self._fetch_page_data(menu.author, page)
+        if instance_data is not None and "DestinyInventoryItemDefinition" in self.cog._manifest:
+            # Without the manifest in memory every perk lookup parses the whole
+            # definitions file, so leave those for when the page is actually shown
+            perk_hashes = [i["perkHash"] for i in instance_data["perks"]["data"]["perks"]]
+            await self._defs("DestinyInventoryItemDefinition", perk_hashes)
+
     async def format_page(self, menu: menus.MenuPages, page):
         self.current_item_hash = page["itemHash"]
         self.current_item_instance = page.get("itemInstanceId", None)
-        items = await self.cog.get_definition(
-            "DestinyInventoryItemDefinition", [self.current_item_hash]
-        )
-        item_data = items[str(self.current_item_hash)]
-        embed = discord.Embed(
-            title=item_data.get("displayProperties", {"name": "None"}).get("name")
-        )
-        if "displayProperties" in item_data:
-            embed.set_thumbnail(url=BASE_URL + item_data["displayProperties"]["icon"])
-        if item_data.get("screenshot", None):
-            embed.set_image(url=BASE_URL + item_data["screenshot"])
-        if self.current_item_instance is not None:
-            instance_data = await self.cog.get_instanced_item(
-                menu.author, self.current_item_instance
-            )
-            perk_hashes = [i["perkHash"] for i in instance_data["perks"]["data"]["perks"]]
-            perk_info = await self.cog.get_definition(
-                "DestinyInventoryItemDefinition", perk_hashes
-            )
-            perk_str = "\n".join(perk["displayProperties"]["name"] for perk in perk_info.values())
+        items, instance_data = await self._fetch_page_data(menu.author, page)
+        item_hash = int(self.current_item_hash)
+        if item_hash not in self._item_views:
+            self._item_views[item_hash] = ItemView.from_definition(items[str(item_hash)])
+        item = self._item_views[item_hash]
+        embed = discord.Embed(title=item.name)
+        if item.icon_url:
+            embed.set_thumbnail(url=item.icon_url)
+        if item.screenshot_url:
+            embed.set_image(url=item.screenshot_url)
+        if instance_data is not None:
+            perk_hashes = [int(i["perkHash"]) for i in instance_data["perks"]["data"]["perks"]]
+            missing = [h for h in perk_hashes if h not in self._perk_names]
+            if missing:
+                perk_info = await self._defs("DestinyInventoryItemDefinition", missing)
+                for key, perk in perk_info.items():
+                    self._perk_names[int(key)] = perk["displayProperties"]["name"]
+            perk_str = "\n".join(self._perk_names[h] for h in perk_hashes if h in self._perk_names)
             embed.description = perk_str
 
         embed.set_footer(text=f"Page {menu.current_page + 1}/{self.get_max_pages()}")
@@ -258,7 +417,7 @@ class LastItemButton(discord.ui.Button):
         )
 
     async def callback(self, interaction: discord.Interaction):
-        await self.view.show_page(self.view._source.get_max_pages() - 1, interaction)
+        await self.view.show_page(self.view._max_pages - 1, interaction)
 
 
 class FirstItemButton(discord.ui.Button):
@@ -322,6 +481,7 @@ class DestinyCharacterSelect(discord.ui.Select):
         index = self.values[0]
         new_source = LoadoutPages(self.view.source.loadout_info, index)
         self.view._source = new_source
+        self.view._cache_source_info()
         self.view.remove_item(self.view.select_view)
         self.view.select_view = self.view._get_select_menu()
         self.view.add_item(self.view.select_view)
@@ -544,59 +704,117 @@ class BaseMenu(discord.ui.View):
                 options.append(discord.SelectOption(label=info["char_info"], value=char_id))
             self.char_select = DestinyCharacterSelect(options)
             self.add_item(self.char_select)
-        if hasattr(self.source, "select_options"):
+        self._select_window: Tuple[Optional[int], Optional[int]] = (None, 25)
+        self._cache_source_info()
+        if self._has_select:
             self.select_view = self._get_select_menu()
             self.add_item(self.select_view)
         self.author = None
+        self._author_id: Optional[int] = None
+        self._prefetched: Set[int] = set()
+        self._prefetch_tasks: Set[asyncio.Task] = set()
 
     @property
     def source(self):
         return self._source
 
+    def _cache_source_info(self):
+        # These are checked on every interaction so only look them up when the source changes
+        self._has_select = hasattr(self._source, "select_options")
+        self._has_prefetch = hasattr(self._source, "prefetch")
+        self._max_pages = self._source.get_max_pages()
+
+    def _cancel_prefetch(self):
+        for task in self._prefetch_tasks:
+            task.cancel()
+
+    def stop(self):
+        self._cancel_prefetch()
+        super().stop()
+
     async def on_timeout(self):
-        await self.message.edit(view=None)
+        self._cancel_prefetch()
+        if self.message is None:
+            return
+        try:
+            await self.message.edit(view=None)
+        except discord.HTTPException:
+            # The message may have been deleted or we lost permission to edit it
+            log.debug("Could not remove the view from the menu message", exc_info=True)
+
+    async def _prefetch(self, page_number: int):
+        try:
+            page = await self._source.get_page(page_number)
+            await self._source.prefetch(self, page)
+        except Exception:
+            # prefetching is best effort, the page will be fetched normally when shown
+            self._prefetched.discard(page_number)
+            log.debug("Error prefetching page %s", page_number, exc_info=True)
+
+    def _schedule_prefetch(self, page_number: int):
+        if not self._has_prefetch:
+            return
+        max_pages = self._max_pages
+        for number in (page_number + 1, page_number - 1):
+            if max_pages:
+                number %= max_pages
+            if number in self._prefetched:
+                continue
+            self._prefetched.add(number)
+            task = asyncio.create_task(self._prefetch(number))
+            self._prefetch_tasks.add(task)
+            task.add_done_callback(self._prefetch_tasks.discard)
 
     async def start(self, ctx: commands.Context):
         self.ctx = ctx
+        self._author_id = ctx.author.id
+        if isinstance(self._source, VaultPages):
+            task = self._source.start_preload()
+            self._prefetch_tasks.add(task)
+            task.add_done_callback(self._prefetch_tasks.discard)
         # await self.source._prepare_once()
         self.message = await self.send_initial_message(ctx)
 
     def check_disabled_buttons(self):
-        if len(self._source.entries) == 1:
-            self.first_item.disabled = True
-            self.last_item.disabled = True
-            self.back_button.disabled = True
-            self.forward_button.disabled = True
-            if hasattr(self.source, "select_options"):
-                self.select_view.disabled = True
-        else:
-            self.first_item.disabled = False
-            self.last_item.disabled = False
-            self.back_button.disabled = False
-            self.forward_button.disabled = False
-            if hasattr(self.source, "select_options"):
-                self.select_view.disabled = False
-
-    def _get_select_menu(self) -> Optional[DestinySelect]:
+        disabled = len(self._source.entries) == 1
+        items = [self.first_item, self.last_item, self.back_button, self.forward_button]
+        if self._has_select:
+            items.append(self.select_view)
+        for item in items:
+            if item.disabled != disabled:
+                item.disabled = disabled
+
+    def _get_select_window(self) -> Tuple[Optional[int], Optional[int]]:
         # handles modifying the select menu if more than 25 pages are provided
         # this will show the previous 12 and next 13 pages in the select menu
         # based on the currently displayed page. Once you reach close to the max
         # pages it will display the last 25 pages.
-        if not hasattr(self.source, "select_options"):
-            return None
+        minus_diff = None
+        plus_diff = 25
         if len(self.source.select_options) > 25:
-            minus_diff = None
-            plus_diff = 25
             if 12 < self.current_page < len(self.source.select_options) - 25:
                 minus_diff = self.current_page - 12
                 plus_diff = self.current_page + 13
             elif self.current_page >= len(self.source.select_options) - 25:
                 minus_diff = len(self.source.select_options) - 25
                 plus_diff = None
-            options = self.source.select_options[minus_diff:plus_diff]
-        else:
-            options = self.source.select_options[:25]
-        return DestinySelect(options)
+        return minus_diff, plus_diff
+
+    def _get_select_menu(self) -> Optional[DestinySelect]:
+        if not self._has_select:
+            return None
+        self._select_window = self._get_select_window()
+        minus_diff, plus_diff = self._select_window
+        return DestinySelect(self.source.select_options[minus_diff:plus_diff])
+
+    def _update_select_menu(self):
+        # Only touch the select menu if the displayed window of options has moved
+        window = self._get_select_window()
+        if window == self._select_window:
+            return
+        self._select_window = window
+        minus_diff, plus_diff = window
+        self.select_view.options = self.source.select_options[minus_diff:plus_diff]
 
     async def _get_kwargs_from_page(self, page):
         value = await discord.utils.maybe_coroutine(self._source.format_page, self, page)
@@ -622,17 +840,17 @@ class BaseMenu(discord.ui.View):
             self.add_item(self.source.current_select)
         self.message = await ctx.send(**kwargs, view=self)
         self.author = ctx.author
+        self._prefetched.add(self.current_page)
+        self._schedule_prefetch(self.current_page)
         return self.message
 
     async def show_page(self, page_number: int, interaction: discord.Interaction):
         if isinstance(self.source, PostmasterPages):
             self.remove_item(self.postmaster)
         page = await self._source.get_page(page_number)
-        if hasattr(self.source, "select_options") and page_number >= 12:
-            self.remove_item(self.select_view)
-            self.select_view = self._get_select_menu()
-            self.add_item(self.select_view)
-        self.current_page = self.source.pages.index(page)
+        self.current_page = page_number
+        if self._has_select:
+            self._update_select_menu()
         kwargs = await self._get_kwargs_from_page(page)
         if isinstance(self.source, PostmasterPages):
             self.postmaster = self.source.current_select
@@ -642,9 +860,11 @@ class BaseMenu(discord.ui.View):
             await self.message.edit(**kwargs, view=self)
         else:
             await interaction.response.edit_message(**kwargs, view=self)
+        self._prefetched.add(self.current_page)
+        self._schedule_prefetch(self.current_page)
 
     async def show_checked_page(self, page_number: int, interaction: discord.Interaction) -> None:
-        max_pages = self._source.get_max_pages()
+        max_pages = self._max_pages
         try:
             if max_pages is None:
                 # If it doesn't give maximum pages, it cannot be checked
@@ -661,7 +881,7 @@ class BaseMenu(discord.ui.View):
 
     async def interaction_check(self, interaction: discord.Interaction):
         """Just extends the default reaction_check to use owner_ids"""
-        if interaction.user.id not in (self.author.id,):
+        if interaction.user.id != self._author_id:
             await interaction.response.send_message(
                 content=_("You are not authorized to interact with this."), ephemeral=True
             )
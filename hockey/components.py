@@ -1,6 +1,6 @@
 import re
 from datetime import datetime
-from typing import List, Optional, Pattern
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 
 import discord
 from red_commons.logging import getLogger
@@ -13,6 +13,69 @@ from .helper import DATE_RE
 _ = Translator("Hockey", __file__)
 log = getLogger("red.trusty-cogs.hockey")
 
+
+def _filter_regex() -> Tuple[Pattern, Dict[str, List[str]]]:
+    """
+    Builds one pattern matching every team name, tri code, and nickname
+    along with the teams each named group refers to
+    """
+    words: Dict[str, List[str]] = {}
+    for team, data in TEAMS.items():
+        if "Team" in team:
+            continue
+        for word in [data["tri_code"], *team.split(), *(data["nickname"] or [])]:
+            # some words like New and York are shared between teams
+            word_teams = words.setdefault(word.lower(), [])
+            if team not in word_teams:
+                word_teams.append(team)
+    # longest first so a shorter word can't win the alternation at the same position
+    ordered = sorted(words, key=len, reverse=True)
+    groups = {f"w{i}": words[word] for i, word in enumerate(ordered)}
+    pattern = "|".join(rf"(?P<w{i}>\b{re.escape(word)}\b)" for i, word in enumerate(ordered))
+    return re.compile(pattern, flags=re.I), groups
+
+
+def _team_pattern(team: str, data: dict) -> Pattern:
+    pattern = rf"{team}|{data['tri_code']}|{'|'.join(n for n in data['nickname'])}"
+    return re.compile(pattern, flags=re.I)
+
+
+# The team names, tri codes, and nicknames never change at runtime
+# so the patterns used to look teams up are only built once
+_FILTER_RE, _FILTER_GROUPS = _filter_regex()
+_TEAM_PATTERNS: List[Tuple[str, Pattern]] = [
+    (team, _team_pattern(team, data)) for team, data in TEAMS.items() if "Team" not in team
+]
+# Parsed once instead of every time a button is created
+_STOP_EMOJI = discord.PartialEmoji.from_str("\N{HEAVY MULTIPLICATION X}\N{VARIATION SELECTOR-16}")
+_FORWARD_EMOJI = discord.PartialEmoji.from_str(
+    "\N{BLACK RIGHT-POINTING TRIANGLE}\N{VARIATION SELECTOR-16}"
+)
+_BACK_EMOJI = discord.PartialEmoji.from_str(
+    "\N{BLACK LEFT-POINTING TRIANGLE}\N{VARIATION SELECTOR-16}"
+)
+_LAST_EMOJI = discord.PartialEmoji.from_str(
+    "\N{BLACK RIGHT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}"
+)
+_FIRST_EMOJI = discord.PartialEmoji.from_str(
+    "\N{BLACK LEFT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}"
+)
+
+# Heatmap and Gameflow buttons cycle through these in order
+_HEATMAP_STYLES = ("all", "ev", "5v5", "sva", "home5v4", "away5v4")
+_GAMEFLOW_STATES = (
+    (True, "all"),
+    (True, "ev"),
+    (True, "5v5"),
+    (True, "sva"),
+    (False, "all"),
+    (False, "ev"),
+    (False, "5v5"),
+    (False, "sva"),
+)
+_NEXT_HEATMAP_STYLE = dict(zip(_HEATMAP_STYLES, _HEATMAP_STYLES[1:] + _HEATMAP_STYLES[:1]))
+_NEXT_GAMEFLOW_STATE = dict(zip(_GAMEFLOW_STATES, _GAMEFLOW_STATES[1:] + _GAMEFLOW_STATES[:1]))
+
 __all__ = (
     "StopButton",
     "ForwardButton",
@@ -40,7 +103,7 @@ class StopButton(discord.ui.Button):
             style = discord.ButtonStyle.red
         super().__init__(style=style, row=row)
         self.style = style
-        self.emoji = "\N{HEAVY MULTIPLICATION X}\N{VARIATION SELECTOR-16}"
+        self.emoji = _STOP_EMOJI
 
     async def callback(self, interaction: discord.Interaction):
         self.view.stop()
@@ -58,7 +121,7 @@ class ForwardButton(discord.ui.Button):
     ):
         super().__init__(style=style, row=row)
         self.style = style
-        self.emoji = "\N{BLACK RIGHT-POINTING TRIANGLE}\N{VARIATION SELECTOR-16}"
+        self.emoji = _FORWARD_EMOJI
 
     async def callback(self, interaction: discord.Interaction):
         await self.view.show_checked_page(self.view.current_page + 1, interaction)
@@ -72,7 +135,7 @@ class BackButton(discord.ui.Button):
     ):
         super().__init__(style=style, row=row)
         self.style = style
-        self.emoji = "\N{BLACK LEFT-POINTING TRIANGLE}\N{VARIATION SELECTOR-16}"
+        self.emoji = _BACK_EMOJI
 
     async def callback(self, interaction: discord.Interaction):
         await self.view.show_checked_page(self.view.current_page - 1, interaction)
@@ -86,9 +149,7 @@ class LastItemButton(discord.ui.Button):
     ):
         super().__init__(style=style, row=row)
         self.style = style
-        self.emoji = (
-            "\N{BLACK RIGHT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}"
-        )
+        self.emoji = _LAST_EMOJI
 
     async def callback(self, interaction: discord.Interaction):
         await self.view.show_page(self.view._source.get_max_pages() - 1, interaction)
@@ -102,9 +163,7 @@ class FirstItemButton(discord.ui.Button):
     ):
         super().__init__(style=style, row=row)
         self.style = style
-        self.emoji = (
-            "\N{BLACK LEFT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}"
-        )
+        self.emoji = _FIRST_EMOJI
 
     async def callback(self, interaction: discord.Interaction):
         await self.view.show_page(0, interaction)
@@ -118,9 +177,7 @@ class SkipForwardButton(discord.ui.Button):
     ):
         super().__init__(style=style, row=row)
         self.style = style
-        self.emoji = (
-            "\N{BLACK RIGHT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}"
-        )
+        self.emoji = _LAST_EMOJI
 
     async def callback(self, interaction: discord.Interaction):
         await self.view.show_page(0, skip_next=True, interaction=interaction)
@@ -134,9 +191,7 @@ class SkipBackButton(discord.ui.Button):
     ):
         super().__init__(style=style, row=row)
         self.style = style
-        self.emoji = (
-            "\N{BLACK LEFT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}"
-        )
+        self.emoji = _FIRST_EMOJI
 
     async def callback(self, interaction: discord.Interaction):
         await self.view.show_page(0, skip_prev=True, interaction=interaction)
@@ -170,8 +225,7 @@ class FilterModal(discord.ui.Modal):
         if self.date.value:
             search = DATE_RE.search(self.date.value)
             if search:
-                date_str = f"{search.group(1)}-{search.group(3)}-{search.group(4)}"
-                date = datetime.strptime(date_str, "%Y-%m-%d")
+                date = datetime(int(search.group(1)), int(search.group(3)), int(search.group(4)))
                 self.view.source.date = date
                 try:
                     await self.view.source.prepare()
@@ -179,23 +233,11 @@ class FilterModal(discord.ui.Modal):
                     await interaction.response.send_message(self.view.format_error())
                     return
         if self.teams.value:
-            potential_teams = self.teams.value.split()
-            teams: List[str] = []
-            for team, data in TEAMS.items():
-                if "Team" in team:
-                    continue
-                nick = data["nickname"]
-                short = data["tri_code"]
-                pattern = rf"{short}\b|" + r"|".join(rf"\b{i}\b" for i in team.split())
-                if nick:
-                    pattern += r"|" + r"|".join(rf"\b{i}\b" for i in nick)
-                log.trace("FilterModal pattern: %s", pattern)
-                reg: Pattern = re.compile(rf"\b{pattern}", flags=re.I)
-                for pot in potential_teams:
-                    find = reg.findall(pot)
-                    if find:
-                        teams.append(team)
-                self.view.source.team = teams
+            teams: Set[str] = set()
+            for potential_team in self.teams.value.split():
+                for match in _FILTER_RE.finditer(potential_team):
+                    teams.update(_FILTER_GROUPS[match.lastgroup])
+            self.view.source.team = list(teams)
             try:
                 await self.view.source.prepare()
             except NoSchedule:
@@ -228,12 +270,7 @@ class TeamModal(discord.ui.Modal):
 
     async def on_submit(self, interaction: discord.Interaction):
         teams: List[str] = []
-        for team, data in TEAMS.items():
-            if "Team" in team:
-                continue
-            pattern = rf"{team}|{data['tri_code']}|{'|'.join(n for n in data['nickname'])}"
-            log.trace("TeamModal pattern: %s", pattern)
-            reg: Pattern = re.compile(pattern, flags=re.I)
+        for team, reg in _TEAM_PATTERNS:
             find = reg.search(self.team.value)
             if find:
                 teams.append(team)
@@ -272,14 +309,6 @@ class HeatmapButton(discord.ui.Button):
 
     async def callback(self, interaction: discord.Interaction):
         """stops the pagination session."""
-        mapping = {
-            "all": "ev",
-            "ev": "5v5",
-            "5v5": "sva",
-            "sva": "home5v4",
-            "home5v4": "away5v4",
-            "away5v4": "all",
-        }
         if self.view.source.include_gameflow:
             self.view.source.include_gameflow = False
         if not self.view.source.include_heatmap:
@@ -288,7 +317,7 @@ class HeatmapButton(discord.ui.Button):
             await self.view.show_page(self.view.current_page, interaction=interaction)
             return
         else:
-            self.view.source.style = mapping[self.view.source.style]
+            self.view.source.style = _NEXT_HEATMAP_STYLE[self.view.source.style]
             self.label = _("Heatmap {style}").format(style=self.view.source.style)
             await self.view.show_page(self.view.current_page, interaction=interaction)
             return
@@ -316,16 +345,6 @@ class GameflowButton(discord.ui.Button):
 
     async def callback(self, interaction: discord.Interaction):
         """stops the pagination session."""
-        mapping = {
-            (True, "all"): (True, "ev"),
-            (True, "ev"): (True, "5v5"),
-            (True, "5v5"): (True, "sva"),
-            (True, "sva"): (False, "all"),
-            (False, "all"): (False, "ev"),
-            (False, "ev"): (False, "5v5"),
-            (False, "5v5"): (False, "sva"),
-            (False, "sva"): (True, "all"),
-        }
         if self.view.source.include_heatmap:
             self.view.source.include_heatmap = False
         if not self.view.source.include_gameflow:
@@ -337,7 +356,7 @@ class GameflowButton(discord.ui.Button):
             return
         else:
             lookup = (self.view.source.corsi, self.view.source.strength)
-            corsi_bool, strength = mapping[lookup]
+            corsi_bool, strength = _NEXT_GAMEFLOW_STATE[lookup]
             self.view.source.corsi = corsi_bool
             self.view.source.strength = strength
             corsi = "Corsi" if corsi_bool else "Expected Goals"
@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from enum import Enum
-from typing import Dict, List, Literal, Optional, Tuple, Union
+from functools import cached_property, lru_cache
+from typing import Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 import aiohttp
 import discord
 from red_commons.logging import getLogger
 from redbot.core.bot import Red
 from redbot.core.i18n import Translator
-from redbot.core.utils import AsyncIter
+from redbot.core.utils import bounded_gather
 from redbot.core.utils.chat_formatting import pagify
 
 from .constants import BASE_URL, CONTENT_URL, TEAMS
@@ -21,14 +22,72 @@ from .helper import (
     get_channel_obj,
     get_team,
     get_team_role,
+    get_teams,
+    parse_timestamp,
     utc_to_local,
 )
 from .standings import LeagueRecord, Playoffs, Standings
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 _ = Translator("Hockey", __file__)
 
 log = getLogger("red.trusty-cogs.Hockey")
 
+# Maximum number of channel posts in flight at once for a single game update
+POST_LIMIT = 32
+
+NHL_LOGO = "https://cdn.bleacherreport.net/images/team_logos/328x328/nhl.png"
+_HOME_FALLBACK = (NHL_LOGO, "\N{HOUSE BUILDING}\N{VARIATION SELECTOR-16}")
+_AWAY_FALLBACK = (NHL_LOGO, "\N{AIRPLANE}\N{VARIATION SELECTOR-16}")
+# (upper minutes, lower minutes, time left) windows for the pre-game reminders
+_PREVIEW_THRESHOLDS = ((60, 30, "60"), (30, 10, "30"), (10, 0, "10"))
+_PERIOD_ENDS = {1: "1st", 2: "2nd", 3: "3rd"}
+_PERIOD_BUCKET = {
+    "1st": "1st",
+    "2nd": "2nd",
+    "3rd": "3rd",
+    "OT": "OT",
+    "2OT": "OT",
+    "3OT": "OT",
+    "4OT": "OT",
+    "5OT": "OT",
+    "SO": "SO",
+}
+_TEAM_DERIVED: Dict[str, Tuple[str, str]] = {}
+_TEAM_EMOJI: Dict[str, str] = {}
+_TEAM_COLOUR: Dict[str, int] = {}
+_TEAM_URL: Dict[str, str] = {}
+
+
+@lru_cache(maxsize=1)
+def _date_str(ordinal: int) -> str:
+    return date.fromordinal(ordinal).strftime("%Y-%m-%d")
+
+
+def build_team_cache() -> None:
+    """
+    Precomputes the per team values used when creating Game objects and embeds
+
+    This needs to be called again whenever TEAMS is modified
+    """
+    _TEAM_DERIVED.clear()
+    _TEAM_EMOJI.clear()
+    _TEAM_COLOUR.clear()
+    _TEAM_URL.clear()
+    for name, info in TEAMS.items():
+        emoji = f"<:{info['emoji']}>"
+        _TEAM_DERIVED[name] = (info["logo"], emoji)
+        _TEAM_EMOJI[name] = emoji
+        _TEAM_COLOUR[name] = int(info["home"].replace("#", ""), 16)
+        _TEAM_URL[name] = info["team_url"]
+
+
+build_team_cache()
+
 
 class GameType(Enum):
     pre_season = "PR"
@@ -148,9 +207,7 @@ class ScheduleGame:
 
     @classmethod
     def from_json(cls, data: dict) -> ScheduleGame:
-        game_start_str = data.get("gameDate", "")
-        game_start = datetime.strptime(game_start_str, "%Y-%m-%dT%H:%M:%SZ")
-        game_start = game_start.replace(tzinfo=timezone.utc)
+        game_start = parse_timestamp(data.get("gameDate", ""))
         return cls(
             gamePk=data["gamePk"],
             link=data["link"],
@@ -195,9 +252,14 @@ class Game:
     home_roster: Optional[dict]
     link: Optional[str]
 
+    _session: Optional[aiohttp.ClientSession] = None
+    # game_id: goals seen by the last completed check_team_goals
+    _goal_signatures: Dict[int, Tuple[Tuple[str, str, Optional[str]], ...]] = {}
+
     def __init__(self, **kwargs):
         super().__init__()
         self.game_id = kwargs.get("game_id")
+        self._game_id_suffix = str(self.game_id)[5:] if self.game_id else ""
         self.game_state = kwargs.get("game_state")
         self.home_team = kwargs.get("home_team")
         self.away_team = kwargs.get("away_team")
@@ -214,30 +276,8 @@ class Game:
         self.period_starts = kwargs.get("period_starts", {})
         self.plays = kwargs.get("plays")
         self.game_start_str = kwargs.get("game_start", "")
-        game_start = datetime.strptime(self.game_start_str, "%Y-%m-%dT%H:%M:%SZ")
-        self.game_start = game_start.replace(tzinfo=timezone.utc)
-        home_team = kwargs.get("home_team")
-        away_team = kwargs.get("away_team")
-        self.home_logo = (
-            TEAMS[home_team]["logo"]
-            if home_team in TEAMS
-            else "https://cdn.bleacherreport.net/images/team_logos/328x328/nhl.png"
-        )
-        self.away_logo = (
-            TEAMS[away_team]["logo"]
-            if away_team in TEAMS
-            else "https://cdn.bleacherreport.net/images/team_logos/328x328/nhl.png"
-        )
-        self.home_emoji = (
-            "<:{}>".format(TEAMS[home_team]["emoji"])
-            if home_team in TEAMS
-            else "\N{HOUSE BUILDING}\N{VARIATION SELECTOR-16}"
-        )
-        self.away_emoji = (
-            "<:{}>".format(TEAMS[away_team]["emoji"])
-            if away_team in TEAMS
-            else "\N{AIRPLANE}\N{VARIATION SELECTOR-16}"
-        )
+        self.home_logo, self.home_emoji = _TEAM_DERIVED.get(self.home_team, _HOME_FALLBACK)
+        self.away_logo, self.away_emoji = _TEAM_DERIVED.get(self.away_team, _AWAY_FALLBACK)
         self.first_star = kwargs.get("first_star")
         self.second_star = kwargs.get("second_star")
         self.third_star = kwargs.get("third_star")
@@ -248,19 +288,67 @@ class Game:
         self.season = kwargs.get("season")
         self._recap_url: Optional[str] = kwargs.get("recap_url", None)
         self.data = kwargs.get("data", {})
+        self._team_goals: Tuple[List[Goal], List[Goal]] = ([], [])
+        # the goals list and its length the split was made from
+        self._team_goals_key: Optional[Tuple[List[Goal], int]] = None
+        self._channels_cache: Optional[Dict[int, dict]] = None
+        self._channel_objs: Dict[int, Optional[Union[discord.TextChannel, discord.Thread]]] = {}
 
     def __repr__(self):
         return "<Hockey Game home={0.home_team} away={0.away_team} state={0.game_state}>".format(
             self
         )
 
+    async def _load_channels(self, bot: Red) -> Dict[int, dict]:
+        """
+        Returns all channel settings only reading Config once per game check
+        """
+        if self._channels_cache is None:
+            all_channels = await bot.get_cog("Hockey").config.all_channels()
+            for data in all_channels.values():
+                # these are checked for every channel on every post
+                data["game_states"] = frozenset(data["game_states"])
+                data["publish_states"] = frozenset(data["publish_states"])
+            self._channels_cache = all_channels
+        return self._channels_cache
+
+    async def _get_channel_obj(
+        self, bot: Red, channel_id: int, data: dict
+    ) -> Optional[Union[discord.TextChannel, discord.Thread]]:
+        """
+        Resolves the channel object only once per game check
+        """
+        if channel_id not in self._channel_objs:
+            self._channel_objs[channel_id] = await get_channel_obj(bot, channel_id, data)
+        return self._channel_objs[channel_id]
+
+    def _split_goals(self) -> Tuple[List[Goal], List[Goal]]:
+        """
+        Splits the goals by team only rescanning when the goals have changed
+        """
+        key = self._team_goals_key
+        if key is None or key[0] is not self.goals or key[1] != len(self.goals):
+            home, away = [], []
+            for goal in self.goals:
+                if goal.team_name == self.home_team:
+                    home.append(goal)
+                elif goal.team_name == self.away_team:
+                    away.append(goal)
+            self._team_goals = (home, away)
+            self._team_goals_key = (self.goals, len(self.goals))
+        return self._team_goals
+
     @property
     def home_goals(self):
-        return [g for g in self.goals if g.team_name == self.home_team]
+        return self._split_goals()[0]
 
     @property
     def away_goals(self):
-        return [g for g in self.goals if g.team_name == self.away_team]
+        return self._split_goals()[1]
+
+    @cached_property
+    def game_start(self) -> datetime:
+        return parse_timestamp(self.game_start_str)
 
     @property
     def recap_url(self):
@@ -294,7 +382,7 @@ class Game:
             "period_ord": self.period_ord,
             "period_time_left": self.period_time_left,
             "plays": self.plays,
-            "game_start": self.game_start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "game_start": self.game_start_str,
             "home_logo": self.home_logo,
             "away_logo": self.away_logo,
             "home_emoji": self.home_emoji,
@@ -306,6 +394,31 @@ class Game:
             "link": self.link,
         }
 
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """
+        Returns a shared session for requests made without the cogs session
+        so that connections can be reused between requests
+        """
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return cls._session
+
+    @classmethod
+    async def close_session(cls) -> None:
+        if cls._session is not None:
+            await cls._session.close()
+            cls._session = None
+
     @staticmethod
     async def get_games(
         team: Optional[str] = None,
@@ -322,23 +435,26 @@ class Game:
 
         returns a list of game objects
         """
+        session = session or Game._get_session()
         games_list = await Game.get_games_list(team, start_date, end_date, session)
+
+        async def _fetch_one(link: str) -> Game:
+            async with session.get(BASE_URL + link) as resp:
+                data = json_loads(await resp.read())
+            log.verbose("get_games, url: %s%s", BASE_URL, link)
+            return await Game.from_json(data)
+
+        results = await bounded_gather(
+            *[_fetch_one(games["link"]) for games in games_list],
+            return_exceptions=True,
+            limit=8,
+        )
         return_games_list = []
-        if games_list != []:
-            for games in games_list:
-                try:
-                    if session is None:
-                        async with aiohttp.ClientSession() as new_session:
-                            async with new_session.get(BASE_URL + games["link"]) as resp:
-                                data = await resp.json()
-                    else:
-                        async with session.get(BASE_URL + games["link"]) as resp:
-                            data = await resp.json()
-                    log.verbose("get_games, url: %s%s", BASE_URL, games["link"])
-                    return_games_list.append(await Game.from_json(data))
-                except Exception:
-                    log.error("Error grabbing game data:", exc_info=True)
-                    continue
+        for result in results:
+            if isinstance(result, Exception):
+                log.error("Error grabbing game data:", exc_info=result)
+                continue
+            return_games_list.append(result)
         return return_games_list
 
     @staticmethod
@@ -346,41 +462,33 @@ class Game:
         game_id: int, session: Optional[aiohttp.ClientSession] = None
     ) -> dict:
         data = {}
-        if session is None:
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(CONTENT_URL.format(game_id)) as resp:
-                        data = await resp.json()
-            except Exception:
-                log.exception("error pulling game content")
-                pass
-        else:
-            try:
-                async with session.get(CONTENT_URL.format(game_id)) as resp:
-                    data = await resp.json()
-            except Exception:
-                log.exception("error pulling game content")
-                pass
+        session = session or Game._get_session()
+        try:
+            async with session.get(CONTENT_URL.format(game_id)) as resp:
+                data = json_loads(await resp.read())
+        except Exception:
+            log.exception("error pulling game content")
+            pass
         return data
 
     @staticmethod
     async def get_game_recap_from_content(content: dict) -> Optional[str]:
-        recap_url = None
-        for _item in (
-            content.get("editorial", {"recap": {}}).get("recap", {"items": []}).get("items", [])
-        ):
-            if "playbacks" not in _item["media"]:
-                continue
-            for _playback in _item["media"]["playbacks"]:
-                if _playback["name"] == "FLASH_1800K_896x504":
-                    recap_url = _playback["url"]
-        return recap_url
+        items = (content.get("editorial") or {}).get("recap", {}).get("items") or []
+        return next(
+            (
+                _playback["url"]
+                for _item in items
+                for _playback in _item.get("media", {}).get("playbacks", [])
+                if _playback.get("name") == "FLASH_1800K_896x504"
+            ),
+            None,
+        )
 
     @staticmethod
     async def get_game_recap(
         game_id: int, session: Optional[aiohttp.ClientSession] = None
     ) -> Optional[str]:
-        content = await Game.get_game_content(game_id)
+        content = await Game.get_game_content(game_id, session)
         return await Game.get_game_recap_from_content(content)
 
     @staticmethod
@@ -399,58 +507,49 @@ class Game:
 
         returns a list of games
         """
-        start_date_str = start_date.strftime("%Y-%m-%d") if start_date is not None else None
-        end_date_str = end_date.strftime("%Y-%m-%d") if end_date is not None else None
+        if team not in ["all", None] and team not in TEAMS:
+            raise KeyError(team)
         params = {}
         url = BASE_URL + "/api/v1/schedule"
-        if start_date is None and end_date is not None:
+        if start_date is not None:
+            params["startDate"] = start_date.strftime("%Y-%m-%d")
+            if end_date is None:
+                # if no end date is provided carry through to the following year
+                params["endDate"] = str(start_date.year + 1) + start_date.strftime("-%m-%d")
+        elif end_date is not None:
             # if no start date is provided start with today
-            params["startDate"] = datetime.now().strftime("%Y-%m-%d")
-            params["endDate"] = end_date_str
-            # url = f"{BASE_URL}/api/v1/schedule?startDate={start_date_str}&endDate={end_date_str}"
-        elif start_date is not None and end_date is None:
-            # if no end date is provided carry through to the following year
-            params["endDate"] = str(start_date.year + 1) + start_date.strftime("-%m-%d")
-            params["startDate"] = start_date_str
-            # url = f"{BASE_URL}/api/v1/schedule?startDate={start_date_str}&endDate={end_date_str}"
-        if start_date_str is not None:
-            params["startDate"] = start_date_str
-        if end_date_str is not None:
-            params["endDate"] = end_date_str
+            params["startDate"] = _date_str(datetime.now().toordinal())
+        if end_date is not None:
+            params["endDate"] = end_date.strftime("%Y-%m-%d")
         if team not in ["all", None]:
             # if a team is provided get just that TEAMS data
-            # url += "&teamId={}".format(TEAMS[team]["id"])
             params["teamId"] = TEAMS[team]["id"]
-        if session is None:
-            async with aiohttp.ClientSession() as new_session:
-                async with new_session.get(url, params=params) as resp:
-                    data = await resp.json()
-        else:
-            async with session.get(url, params=params) as resp:
-                data = await resp.json()
+        session = session or Game._get_session()
+        async with session.get(url, params=params) as resp:
+            data = json_loads(await resp.read())
         game_list = [game for date in data["dates"] for game in date["games"]]
         return game_list
 
     def nst_url(self):
-        return f"https://www.naturalstattrick.com/game.php?season={self.season}&game={str(self.game_id)[5:]}&view=limited#gameflow"
+        return f"https://www.naturalstattrick.com/game.php?season={self.season}&game={self._game_id_suffix}&view=limited#gameflow"
 
     def heatmap_url(self, style: Literal["all", "ev", "5v5", "sva", "home5v4", "away5v4"] = "all"):
         base_url = "https://www.naturalstattrick.com/heatmaps/games/"
         if style == "home5v4":
             home = TEAMS[self.home_team]["tri_code"]
-            return f"{base_url}{self.season}/{self.season}-{str(self.game_id)[5:]}-{home}-5v4.png"
+            return f"{base_url}{self.season}/{self.season}-{self._game_id_suffix}-{home}-5v4.png"
         elif style == "away5v4":
             away = TEAMS[self.away_team]["tri_code"]
-            return f"{base_url}{self.season}/{self.season}-{str(self.game_id)[5:]}-{away}-5v4.png"
+            return f"{base_url}{self.season}/{self.season}-{self._game_id_suffix}-{away}-5v4.png"
         else:
-            return f"{base_url}{self.season}/{self.season}-{str(self.game_id)[5:]}-{style}.png"
+            return f"{base_url}{self.season}/{self.season}-{self._game_id_suffix}-{style}.png"
 
     def gameflow_url(
         self, corsi: bool = True, strength: Literal["all", "ev", "5v5", "sva"] = "all"
     ):
         base_url = "https://www.naturalstattrick.com/graphs/"
         diff = "cfdiff" if corsi else "xgdiff"
-        return f"{base_url}{self.season}-{str(self.game_id)[5:]}-{diff}-{strength}.png"
+        return f"{base_url}{self.season}-{self._game_id_suffix}-{diff}-{strength}.png"
 
     async def make_game_embed(
         self,
@@ -464,38 +563,30 @@ class Game:
         Builds the game embed when the command is called
         provides as much data as possible
         """
-        team_url = (
-            TEAMS[self.home_team]["team_url"] if self.home_team in TEAMS else "https://nhl.com"
-        )
+        home_team, away_team = self.home_team, self.away_team
+        home_emoji, away_emoji = self.home_emoji, self.away_emoji
+        home_logo = self.home_logo
+        state = self.game_state
+        team_url = _TEAM_URL.get(home_team, "https://nhl.com")
         # timestamp = datetime.strptime(self.game_start, "%Y-%m-%dT%H:%M:%SZ")
-        title = "{away} @ {home} {state}".format(
-            away=self.away_team, home=self.home_team, state=self.game_state
-        )
-        colour = (
-            int(TEAMS[self.home_team]["home"].replace("#", ""), 16)
-            if self.home_team in TEAMS
-            else None
-        )
+        title = "{away} @ {home} {state}".format(away=away_team, home=home_team, state=state)
+        colour = _TEAM_COLOUR.get(home_team)
 
         em = discord.Embed(timestamp=self.game_start)
         if colour is not None:
             em.colour = colour
-        em.set_author(name=title, url=team_url, icon_url=self.home_logo)
-        em.set_thumbnail(url=self.home_logo)
+        em.set_author(name=title, url=team_url, icon_url=home_logo)
+        em.set_thumbnail(url=home_logo)
         em.set_footer(
             text=_("{game_type} Game start ").format(game_type=self.game_type_str()),
             icon_url=self.away_logo,
         )
-        if self.game_state == "Preview":
+        if state == "Preview":
             home_str, away_str, desc = await self.get_stats_msg()
             if desc is not None and em.description is None:
                 em.description = desc
-            em.add_field(
-                name=f"{self.away_emoji} {self.away_team} {self.away_emoji}", value=away_str
-            )
-            em.add_field(
-                name=f"{self.home_emoji} {self.home_team} {self.home_emoji}", value=home_str
-            )
+            em.add_field(name=f"{away_emoji} {away_team} {away_emoji}", value=away_str)
+            em.add_field(name=f"{home_emoji} {home_team} {home_emoji}", value=home_str)
         if include_heatmap:
             em.set_image(url=self.heatmap_url())
             em.description = f"[Natural Stat Trick]({self.nst_url()})"
@@ -503,38 +594,32 @@ class Game:
             em.set_image(url=self.gameflow_url())
             em.description = f"[Natural Stat Trick]({self.nst_url()})"
 
-        if self.game_state != "Preview":
+        if state != "Preview":
             home_msg = _("Goals: **{home_score}**\nShots: **{home_shots}**").format(
                 home_score=self.home_score, home_shots=self.home_shots
             )
             away_msg = _("Goals: **{away_score}**\nShots: **{away_shots}**").format(
                 away_score=self.away_score, away_shots=self.away_shots
             )
-            em.add_field(
-                name=f"{self.away_emoji} {self.away_team} {self.away_emoji}", value=away_msg
-            )
-            em.add_field(
-                name=f"{self.home_emoji} {self.home_team} {self.home_emoji}", value=home_msg
-            )
+            em.add_field(name=f"{away_emoji} {away_team} {away_emoji}", value=away_msg)
+            em.add_field(name=f"{home_emoji} {home_team} {home_emoji}", value=home_msg)
 
             if self.goals != [] and include_goals:
-                goal_msg = ""
-                first_goals = [goal for goal in self.goals if goal.period_ord == "1st"]
-                second_goals = [goal for goal in self.goals if goal.period_ord == "2nd"]
-                third_goals = [goal for goal in self.goals if goal.period_ord == "3rd"]
-                ot_goals = [goal for goal in self.goals if "OT" in goal.period_ord]
-                so_goals = [goal for goal in self.goals if goal.period_ord == "SO"]
-                list_goals = {
-                    "1st": first_goals,
-                    "2nd": second_goals,
-                    "3rd": third_goals,
-                    "OT": ot_goals,
-                }
+                list_goals = {"1st": [], "2nd": [], "3rd": [], "OT": []}
+                so_goals = []
+                for goal in self.goals:
+                    bucket = _PERIOD_BUCKET.get(goal.period_ord)
+                    if bucket is None and "OT" in goal.period_ord:
+                        bucket = "OT"
+                    if bucket == "SO":
+                        so_goals.append(goal)
+                    elif bucket is not None:
+                        list_goals[bucket].append(goal)
                 if period_goals:
                     list_goals = {period_goals: list_goals[period_goals]}
                 for goals in list_goals:
                     ordinal = goals
-                    goal_msg = ""
+                    goal_parts = []
 
                     period_start_str = ""
                     period_start = self.period_starts.get(ordinal)
@@ -543,27 +628,29 @@ class Game:
                         period_start_str = f"(<t:{period_start_ts}:t>)"
 
                     for goal in list_goals[ordinal]:
-                        try:
-                            emoji = f"<:{TEAMS[goal.team_name]['emoji']}>"
-                        except KeyError:
-                            emoji = ""
+                        team_name = goal.team_name
+                        time_remaining = goal.time_remaining
+                        emoji = _TEAM_EMOJI.get(team_name, "")
                         left = ""
-                        if goal.time_remaining:
+                        if time_remaining:
                             left = _("\n{time} left in the {ord} period").format(
-                                time=goal.time_remaining, ord=goal.period_ord
+                                time=time_remaining, ord=goal.period_ord
+                            )
+                        goal_parts.append(
+                            _(
+                                "{emoji} [{team} {empty_net}{strength} Goal By {description} {left}]({link})\n\n"
+                            ).format(
+                                emoji=emoji,
+                                team=team_name,
+                                empty_net="EN " if goal.empty_net else "",
+                                strength=goal.strength_code,
+                                description=goal.description,
+                                link=goal.link,
+                                left=left,
                             )
-                        goal_msg += _(
-                            "{emoji} [{team} {empty_net}{strength} Goal By {description} {left}]({link})\n\n"
-                        ).format(
-                            emoji=emoji,
-                            team=goal.team_name,
-                            empty_net="EN " if goal.empty_net else "",
-                            strength=goal.strength_code,
-                            description=goal.description,
-                            link=goal.link,
-                            left=left,
                         )
 
+                    goal_msg = "".join(goal_parts)
                     count = 0
                     continued = _("(Continued)")
                     for page in pagify(
@@ -583,18 +670,14 @@ class Game:
                     home_msg, away_msg = await self.goals[-1].get_shootout_display(self)
                     # get the last goal so that we always post the full current
                     # shootout display here
-                    em.add_field(
-                        name=_("{team} Shootout").format(team=self.home_team), value=home_msg
-                    )
-                    em.add_field(
-                        name=_("{team} Shootout").format(team=self.away_team), value=away_msg
-                    )
+                    em.add_field(name=_("{team} Shootout").format(team=home_team), value=home_msg)
+                    em.add_field(name=_("{team} Shootout").format(team=away_team), value=away_msg)
                 if self.recap_url is not None:
                     em.description = f"[Recap]({self.recap_url})"
             if self.first_star is not None:
                 stars = f"⭐ {self.first_star}\n⭐⭐ {self.second_star}\n⭐⭐⭐ {self.third_star}"
                 em.add_field(name=_("Stars of the game"), value=stars, inline=False)
-            if self.game_state == "Live":
+            if state == "Live":
                 period = self.period_ord
                 if self.period_time_left[0].isdigit():
                     msg = _("{time} Left in the {ordinal} period").format(
@@ -615,13 +698,17 @@ class Game:
         """
         Makes the game state embed based on the game self provided
         """
+        home_team, away_team = self.home_team, self.away_team
+        home_emoji, away_emoji = self.home_emoji, self.away_emoji
+        home_logo = self.home_logo
+        state = self.game_state
         # post_state = ["all", self.home_team, self.away_team]
         # timestamp = datetime.strptime(self.game_start, "%Y-%m-%dT%H:%M:%SZ")
-        title = f"{self.away_team} @ {self.home_team} {self.game_state}"
+        title = f"{away_team} @ {home_team} {state}"
         em = discord.Embed(timestamp=self.game_start)
-        home_field = "{0} {1} {0}".format(self.home_emoji, self.home_team)
-        away_field = "{0} {1} {0}".format(self.away_emoji, self.away_team)
-        if self.game_state != "Preview":
+        home_field = "{0} {1} {0}".format(home_emoji, home_team)
+        away_field = "{0} {1} {0}".format(away_emoji, away_team)
+        if state != "Preview":
             home_str = _("Goals: **{home_score}**\nShots: **{home_shots}**").format(
                 home_score=self.home_score, home_shots=self.home_shots
             )
@@ -634,21 +721,15 @@ class Game:
                 em.description = desc
         em.add_field(name=home_field, value=home_str, inline=False)
         em.add_field(name=away_field, value=away_str, inline=True)
-        colour = (
-            int(TEAMS[self.home_team]["home"].replace("#", ""), 16)
-            if self.home_team in TEAMS
-            else None
-        )
+        colour = _TEAM_COLOUR.get(home_team)
         if colour is not None:
             em.colour = colour
-        home_url = (
-            TEAMS[self.home_team]["team_url"] if self.home_team in TEAMS else "https://nhl.com"
-        )
+        home_url = _TEAM_URL.get(home_team, "https://nhl.com")
         if self.first_star is not None:
             stars = f"⭐ {self.first_star}\n⭐⭐ {self.second_star}\n⭐⭐⭐ {self.third_star}"
             em.add_field(name=_("Stars of the game"), value=stars)
-        em.set_author(name=title, url=home_url, icon_url=self.home_logo)
-        em.set_thumbnail(url=self.home_logo)
+        em.set_author(name=title, url=home_url, icon_url=home_logo)
+        em.set_thumbnail(url=home_logo)
         em.set_footer(text=_("Game start "), icon_url=self.away_logo)
         if self.recap_url is not None:
             em.description = f"[Recap]({self.recap_url})"
@@ -682,26 +763,27 @@ class Game:
                 "GP:**{gp}** W:**{wins}** L:**{losses}\n**OT:**{ot}** PTS:**{pts}** S:**{streak}**\n"
             )
             try:
-                standings = await Standings.get_team_standings()
-                for name, record in standings.all_records.items():
-                    if record.team.name == self.away_team:
-                        away_str = msg.format(
-                            wins=record.league_record.wins,
-                            losses=record.league_record.losses,
-                            ot=record.league_record.ot,
-                            pts=record.points,
-                            gp=record.games_played,
-                            streak=record.streak,
-                        )
-                    if record.team.name == self.home_team:
-                        home_str = msg.format(
-                            wins=record.league_record.wins,
-                            losses=record.league_record.losses,
-                            ot=record.league_record.ot,
-                            pts=record.points,
-                            gp=record.games_played,
-                            streak=record.streak,
-                        )
+                standings = await Standings.get_team_standings_cached()
+                away_record = standings.all_records.get(self.away_team)
+                home_record = standings.all_records.get(self.home_team)
+                if away_record is not None:
+                    away_str = msg.format(
+                        wins=away_record.league_record.wins,
+                        losses=away_record.league_record.losses,
+                        ot=away_record.league_record.ot,
+                        pts=away_record.points,
+                        gp=away_record.games_played,
+                        streak=away_record.streak,
+                    )
+                if home_record is not None:
+                    home_str = msg.format(
+                        wins=home_record.league_record.wins,
+                        losses=home_record.league_record.losses,
+                        ot=home_record.league_record.ot,
+                        pts=home_record.points,
+                        gp=home_record.games_played,
+                        streak=home_record.streak,
+                    )
             except Exception:
                 log.exception("Error pulling stats")
                 pass
@@ -709,44 +791,49 @@ class Game:
             try:
                 desc_str = _("{round_name}:\n{series_status}")
                 msg = _("GP:**{gp}** W:**{wins}** L:**{losses}**")
-                playoffs = await Playoffs.get_playoffs()
-                for rounds in playoffs.rounds:
-                    for series in rounds.series:
-                        for matchup in series.matchupTeams:
-                            if matchup.team.name == self.away_team:
-                                away_str = msg.format(
-                                    gp=series.currentGame.seriesSummary.gameNumber - 1,
-                                    wins=matchup.seriesRecord.wins,
-                                    losses=matchup.seriesRecord.losses,
-                                )
-                            if matchup.team.name == self.home_team:
-                                home_str = msg.format(
-                                    gp=series.currentGame.seriesSummary.gameNumber - 1,
-                                    wins=matchup.seriesRecord.wins,
-                                    losses=matchup.seriesRecord.losses,
-                                )
-                            if (
-                                matchup.team.name == self.away_team
-                                or matchup.team.name == self.home_team
-                            ):
-                                desc = desc_str.format(
-                                    round_name=rounds.names.name,
-                                    series_status=series.currentGame.seriesSummary.seriesStatus,
-                                )
+                playoffs = await Playoffs.get_playoffs_cached()
+                away_entry = playoffs.by_team_name.get(self.away_team)
+                home_entry = playoffs.by_team_name.get(self.home_team)
+                if away_entry is not None:
+                    rounds, series, matchup = away_entry
+                    away_str = msg.format(
+                        gp=series.currentGame.seriesSummary.gameNumber - 1,
+                        wins=matchup.seriesRecord.wins,
+                        losses=matchup.seriesRecord.losses,
+                    )
+                if home_entry is not None:
+                    rounds, series, matchup = home_entry
+                    home_str = msg.format(
+                        gp=series.currentGame.seriesSummary.gameNumber - 1,
+                        wins=matchup.seriesRecord.wins,
+                        losses=matchup.seriesRecord.losses,
+                    )
+                entry = home_entry or away_entry
+                if entry is not None:
+                    rounds, series, matchup = entry
+                    desc = desc_str.format(
+                        round_name=rounds.names.name,
+                        series_status=series.currentGame.seriesSummary.seriesStatus,
+                    )
             except Exception:
                 log.exception("Error pulling playoffs stats")
                 pass
         return home_str, away_str, desc
 
     async def check_game_state(self, bot: Red, count: int = 0) -> bool:
+        # Channel settings are shared by every post made during this check
+        self._channels_cache = None
+        self._channel_objs.clear()
         # post_state = ["all", self.home_team, self.away_team]
         home = await get_team(bot, self.home_team, self.game_start_str, self.game_id)
         # away = await get_team(self.away_team)
         # team_list = await self.config.teams()
         # Home team checking
-        end_first = self.period_time_left == "END" and self.period == 1
-        end_second = self.period_time_left == "END" and self.period == 2
-        end_third = self.period_time_left == "END" and self.period == 3
+        # Only one regulation period can have ended at a time
+        period_end = None
+        if self.period_time_left == "END":
+            period_end = _PERIOD_ENDS.get(self.period)
+        end_third = period_end == "3rd"
         if self.game_state == "Preview":
             """Checks if the the game state has changes from Final to Preview
             Could be unnecessary since after Game Final it will check for next game
@@ -758,21 +845,14 @@ class Game:
                 await self.post_game_state(bot)
                 await self.save_game_state(bot)
                 bot.dispatch("hockey_preview", self)
-            if game_start < 60 and game_start > 30 and home["game_state"] != "Preview60":
-                # Post 60 minutes until game start
-                await self.post_time_to_game_start(bot, "60")
-                await self.save_game_state(bot, "60")
-                bot.dispatch("hockey_preview", self)
-            if game_start < 30 and game_start > 10 and home["game_state"] != "Preview30":
-                # Post 30 minutes until game start
-                await self.post_time_to_game_start(bot, "30")
-                await self.save_game_state(bot, "30")
-                bot.dispatch("hockey_preview", self)
-            if game_start < 10 and game_start > 0 and home["game_state"] != "Preview10":
-                # Post 10 minutes until game start
-                await self.post_time_to_game_start(bot, "10")
-                await self.save_game_state(bot, "10")
-                bot.dispatch("hockey_preview", self)
+            for upper, lower, time_left in _PREVIEW_THRESHOLDS:
+                if lower < game_start < upper:
+                    # Post 60, 30, or 10 minutes until game start
+                    if home["game_state"] != f"Preview{time_left}":
+                        await self.post_time_to_game_start(bot, time_left)
+                        await self.save_game_state(bot, time_left)
+                        bot.dispatch("hockey_preview", self)
+                    break
 
                 # Create channel and look for game day thread
 
@@ -790,30 +870,27 @@ class Game:
                 await self.save_game_state(bot)
                 bot.dispatch("hockey_period_start", self)
 
+            team_data = None
             if (self.home_score + self.away_score) != 0:
                 # Check if there's goals only if there are goals
-                await self.check_team_goals(bot)
-            if end_first and home["game_state"] != "LiveEND1st":
-                log.debug("End of the first period")
-                await self.period_recap(bot, "1st")
-                await self.save_game_state(bot, "END1st")
-            if end_second and home["game_state"] != "LiveEND2nd":
-                log.debug("End of the second period")
-                await self.period_recap(bot, "2nd")
-                await self.save_game_state(bot, "END2nd")
-            if end_third and home["game_state"] not in ["LiveEND3rd", "FinalEND3rd"]:
-                log.debug("End of the third period")
-                await self.period_recap(bot, "3rd")
-                await self.save_game_state(bot, "END3rd")
+                team_data = await self.check_team_goals(bot)
+            if period_end is not None and home["game_state"] not in [
+                f"LiveEND{period_end}",
+                f"FinalEND{period_end}",
+            ]:
+                log.debug("End of the %s period", period_end)
+                await self.period_recap(bot, period_end)
+                await self.save_game_state(bot, f"END{period_end}", team_data)
 
         if self.game_state == "Final":
+            team_data = None
             if (self.home_score + self.away_score) != 0:
                 # Check if there's goals only if there are goals
-                await self.check_team_goals(bot)
+                team_data = await self.check_team_goals(bot)
             if end_third and home["game_state"] not in ["LiveEND3rd", "FinalEND3rd"]:
                 log.debug("End of the third period")
                 await self.period_recap(bot, "3rd")
-                await self.save_game_state(bot, "END3rd")
+                await self.save_game_state(bot, "END3rd", team_data)
 
             if (
                 self.first_star is not None
@@ -827,32 +904,61 @@ class Game:
                     # Post game final data and check for next game
                     log.debug("Game Final %s @ %s", self.away_team, self.home_team)
                     await self.post_game_state(bot)
-                    await self.save_game_state(bot)
+                    await self.save_game_state(bot, team_data=team_data)
                     bot.dispatch("hockey_final", self)
                     log.debug("Saving final")
+                    Game._goal_signatures.pop(self.game_id, None)
                     return True
         return False
 
-    async def period_recap(self, bot: Red, period: Literal["1st", "2nd", "3rd"]) -> None:
+    async def _broadcast(
+        self,
+        bot: Red,
+        send: Callable[[Union[discord.TextChannel, discord.Thread], dict], Optional[Awaitable]],
+        thread_embed: Optional[discord.Embed] = None,
+    ) -> None:
         """
-        Builds the period recap
+        Sends a post to every channel following this game
+
+        `send` is called with each channel and its settings once `check_to_post` passes
+        and returns the coroutine to post with or None to skip the channel.
+        Game day thread start messages are updated with `thread_embed` when provided.
         """
-        em = await self.make_game_embed(False, None)
+        post_state = {"all", self.home_team, self.away_team}
         tasks = []
-        post_state = ["all", self.home_team, self.away_team]
-        config = bot.get_cog("Hockey").config
-        all_channels = await bot.get_cog("Hockey").config.all_channels()
-        async for channel_id, data in AsyncIter(all_channels.items(), steps=100):
-            await self.maybe_edit_gamedaythread_message(bot, channel_id, data)
-            channel = await get_channel_obj(bot, channel_id, data)
+        all_channels = await self._load_channels(bot)
+        for channel_id, data in all_channels.items():
+            if data["team"] is not None and post_state.isdisjoint(data["team"]):
+                # skip channels not following either team before resolving them
+                continue
+            if thread_embed is not None:
+                await self.maybe_edit_gamedaythread_message(bot, channel_id, data, thread_embed)
+            channel = await self._get_channel_obj(bot, channel_id, data)
             if not channel:
                 continue
+            if not await check_to_post(bot, channel, data, post_state, self.game_state):
+                continue
+            coro = send(channel, data)
+            if coro is not None:
+                tasks.append(coro)
+        results = await bounded_gather(*tasks, return_exceptions=True, limit=POST_LIMIT)
+        for result in results:
+            if isinstance(result, Exception):
+                log.error("Error posting game update:", exc_info=result)
+
+    async def period_recap(self, bot: Red, period: Literal["1st", "2nd", "3rd"]) -> None:
+        """
+        Builds the period recap
+        """
+        em = await self.make_game_embed(False, None)
 
-            should_post = await check_to_post(bot, channel, data, post_state, self.game_state)
-            should_post &= "Periodrecap" in await config.channel(channel).game_states()
-            publish = "Periodrecap" in await config.channel(channel).publish_states()
-            if should_post:
-                asyncio.create_task(self.post_period_recap(channel, em, publish))
+        def send(channel: discord.TextChannel, data: dict) -> Optional[Awaitable]:
+            if "Periodrecap" not in data["game_states"]:
+                return None
+            publish = "Periodrecap" in data["publish_states"]
+            return self.post_period_recap(channel, em, publish)
+
+        await self._broadcast(bot, send, thread_embed=em)
 
     async def post_period_recap(
         self, channel: discord.TextChannel, embed: discord.Embed, publish: bool
@@ -874,13 +980,12 @@ class Game:
             log.exception("Could not post goal in %s", repr(channel))
 
     async def maybe_edit_gamedaythread_message(
-        self, bot: Red, channel_id: int, data: dict
+        self, bot: Red, channel_id: int, data: dict, em: discord.Embed
     ) -> None:
         post_state = ["all", self.home_team, self.away_team]
         if data["parent"] and any([i in data["team"] for i in post_state]) and data["update"]:
             try:
-                em = await self.make_game_embed(False, None)
-                parent = await get_channel_obj(bot, data["parent"], data)
+                parent = await self._get_channel_obj(bot, data["parent"], data)
                 msg = parent.get_partial_message(channel_id)
                 asyncio.create_task(msg.edit(embed=em))
             except Exception:
@@ -891,24 +996,28 @@ class Game:
         When a game state has changed this is called to create the embed
         and post in all channels
         """
-        post_state = ["all", self.home_team, self.away_team]
         state_embed = await self.game_state_embed()
         state_text = await self.game_state_text()
-        tasks = []
-        all_channels = await bot.get_cog("Hockey").config.all_channels()
-        async for channel_id, data in AsyncIter(all_channels.items(), steps=100):
-            await self.maybe_edit_gamedaythread_message(bot, channel_id, data)
-            channel = await get_channel_obj(bot, channel_id, data)
-            if not channel:
-                continue
+        em = await self.make_game_embed(False, None)
+        all_guilds = await bot.get_cog("Hockey").config.all_guilds()
+        role_cache: Dict[int, Tuple[str, str]] = {}
+
+        def send(
+            channel: Union[discord.TextChannel, discord.Thread], data: dict
+        ) -> Optional[Awaitable]:
             if channel.guild.me.is_timed_out():
-                continue
-            should_post = await check_to_post(bot, channel, data, post_state, self.game_state)
-            if should_post:
-                asyncio.create_task(
-                    self.actually_post_state(bot, channel, state_embed, state_text)
-                )
-        # previews = await bounded_gather(*tasks)
+                return None
+            return self.actually_post_state(
+                bot,
+                channel,
+                state_embed,
+                state_text,
+                guild_settings=all_guilds.get(channel.guild.id),
+                channel_settings=data,
+                role_cache=role_cache,
+            )
+
+        await self._broadcast(bot, send, thread_embed=em)
 
     async def actually_post_state(
         self,
@@ -916,14 +1025,20 @@ class Game:
         channel: Union[discord.TextChannel, discord.Thread],
         state_embed: discord.Embed,
         state_text: str,
+        guild_settings: Optional[dict] = None,
+        channel_settings: Optional[dict] = None,
+        role_cache: Optional[Dict[int, Tuple[str, str]]] = None,
     ) -> Optional[Tuple[discord.TextChannel, discord.Message]]:
         guild = channel.guild
         if not channel.permissions_for(guild.me).send_messages:
             log.debug("No permission to send messages in %s", repr(channel))
             return None
         config = bot.get_cog("Hockey").config
-        guild_settings = await config.guild(guild).all()
-        channel_settings = await config.channel(channel).all()
+        if guild_settings is None:
+            # guilds without any saved settings are not included in all_guilds
+            guild_settings = await config.guild(guild).all()
+        if channel_settings is None:
+            channel_settings = await config.channel(channel).all()
         game_day_channels = guild_settings["gdc"]
         can_embed = channel.permissions_for(guild.me).embed_links
         publish_states = []  # await config.channel(channel).publish_states()
@@ -939,7 +1054,12 @@ class Game:
             # start_notifications = guild_start or channel_start
             # heh inclusive or
             allowed_mentions = {}
-            home_role, away_role = await get_team_role(guild, self.home_team, self.away_team)
+            if role_cache is None:
+                role_cache = {}
+            if guild.id not in role_cache:
+                # Channels in the same guild share the same team roles
+                role_cache[guild.id] = await get_team_role(guild, self.home_team, self.away_team)
+            home_role, away_role = role_cache[guild.id]
             if state_notifications:
                 allowed_mentions = {"allowed_mentions": discord.AllowedMentions(roles=True)}
             else:
@@ -1002,79 +1122,109 @@ class Game:
                 log.exception("Could not post goal in %s", repr(channel))
         return None
 
-    async def check_team_goals(self, bot: Red) -> None:
+    async def check_team_goals(self, bot: Red) -> Optional[Dict[str, dict]]:
         """
         Checks to see if a goal needs to be posted
+
+        Returns the saved team data so it can be reused by `save_game_state`
+        or None if called back goals were removed from the saved data
+        or nothing has changed since the last check
         """
-        team_data = {
-            self.home_team: await get_team(bot, self.home_team, self.game_start_str, self.game_id),
-            self.away_team: await get_team(bot, self.away_team, self.game_start_str, self.game_id),
-        }
+        goal_signature = tuple((goal.goal_id, goal.description, goal.link) for goal in self.goals)
+        if Game._goal_signatures.get(self.game_id) == goal_signature:
+            return None
+        home, away = await get_teams(
+            bot, [self.home_team, self.away_team], self.game_start_str, self.game_id
+        )
+        team_data = {self.home_team: home, self.away_team: away}
         # home_team_data = await get_team(bot, self.home_team)
         # away_team_data = await get_team(bot, self.away_team)
         # all_data = await get_team("all")
-        team_list = await bot.get_cog("Hockey").config.teams()
+        config = bot.get_cog("Hockey").config
+        team_list = await config.teams()
+        # Mutate the stored entries in place and write them back once after the loop
+        team_index = {name: team_list.index(data) for name, data in team_data.items()}
+        changed = False
         # post_state = ["all", self.home_team, self.away_team]
 
         # home_goal_ids = [goal.goal_id for goal in self.home_goals]
         # away_goal_ids = [goal.goal_id for goal in self.away_goals]
 
-        home_goal_list = list(team_data[self.home_team]["goal_id"])
-        away_goal_list = list(team_data[self.away_team]["goal_id"])
-
-        for goal in self.goals:
-            # goal_id = str(goal["result"]["eventCode"])
-            # team = goal["team"]["name"]
-            # team_data = await get_team(bot, goal.team_name)
-            if goal.goal_id not in team_data[goal.team_name]["goal_id"]:
-                # attempts to post the goal if there is a new goal
-                bot.dispatch("hockey_goal", self, goal)
-                goal.home_shots = self.home_shots
-                goal.away_shots = self.away_shots
-                msg_list = await goal.post_team_goal(bot, self)
-                team_list.remove(team_data[goal.team_name])
-                team_data[goal.team_name]["goal_id"][goal.goal_id] = {
-                    "goal": goal.to_json(),
-                    "messages": msg_list,
-                }
-                team_list.append(team_data[goal.team_name])
-                await bot.get_cog("Hockey").config.teams.set(team_list)
-                continue
-            if goal.goal_id in team_data[goal.team_name]["goal_id"]:
-                # attempts to edit the goal if the scorers have changed
-                old_goal = Goal(**team_data[goal.team_name]["goal_id"][goal.goal_id]["goal"])
-                if goal.description != old_goal.description or goal.link != old_goal.link:
-                    goal.home_shots = old_goal.home_shots
-                    goal.away_shots = old_goal.away_shots
-                    # This is to keep shots consistent between edits
-                    # Shots should not update as the game continues
-                    bot.dispatch("hockey_goal_edit", self, goal)
-                    old_msgs = team_data[goal.team_name]["goal_id"][goal.goal_id]["messages"]
-                    team_list.remove(team_data[goal.team_name])
-                    team_data[goal.team_name]["goal_id"][goal.goal_id]["goal"] = goal.to_json()
-                    team_list.append(team_data[goal.team_name])
-                    await bot.get_cog("Hockey").config.teams.set(team_list)
-                    if old_msgs:
-                        asyncio.create_task(goal.edit_team_goal(bot, self, old_msgs))
+        home_goal_ids = team_data[self.home_team]["goal_id"]
+        away_goal_ids = team_data[self.away_team]["goal_id"]
+        # count the saved goals before any new ones are added below
+        home_diff = abs(len(home_goal_ids) - len(self.home_goals))
+        away_diff = abs(len(away_goal_ids) - len(self.away_goals))
+
+        try:
+            for goal in self.goals:
+                # goal_id = str(goal["result"]["eventCode"])
+                # team = goal["team"]["name"]
+                # team_data = await get_team(bot, goal.team_name)
+                if goal.goal_id not in team_data[goal.team_name]["goal_id"]:
+                    # attempts to post the goal if there is a new goal
+                    bot.dispatch("hockey_goal", self, goal)
+                    goal.home_shots = self.home_shots
+                    goal.away_shots = self.away_shots
+                    msg_list = await goal.post_team_goal(bot, self)
+                    team_data[goal.team_name]["goal_id"][goal.goal_id] = {
+                        "goal": goal.to_json(),
+                        "messages": msg_list,
+                    }
+                    changed = True
+                    continue
+                if goal.goal_id in team_data[goal.team_name]["goal_id"]:
+                    # attempts to edit the goal if the scorers have changed
+                    old_goal = Goal(**team_data[goal.team_name]["goal_id"][goal.goal_id]["goal"])
+                    if goal.description != old_goal.description or goal.link != old_goal.link:
+                        goal.home_shots = old_goal.home_shots
+                        goal.away_shots = old_goal.away_shots
+                        # This is to keep shots consistent between edits
+                        # Shots should not update as the game continues
+                        bot.dispatch("hockey_goal_edit", self, goal)
+                        old_msgs = team_data[goal.team_name]["goal_id"][goal.goal_id]["messages"]
+                        team_data[goal.team_name]["goal_id"][goal.goal_id]["goal"] = goal.to_json()
+                        changed = True
+                        if old_msgs:
+                            asyncio.create_task(goal.edit_team_goal(bot, self, old_msgs))
+        finally:
+            # save whatever was posted even if a later goal fails or the loop is cancelled
+            if changed:
+                for name, index in team_index.items():
+                    team_list[index] = team_data[name]
+                await config.teams.set(team_list)
         # attempts to delete the goal if it was called back
-        home_diff = abs(len(home_goal_list) - len(self.home_goals))
-        away_diff = abs(len(away_goal_list) - len(self.away_goals))
         if 1 < home_diff <= 2:
-            for goal_str in home_goal_list:
+            for goal_str in home_goal_ids:
                 await Goal.remove_goal_post(bot, goal_str, self.home_team, self)
         if 1 < away_diff <= 2:
-            for goal_str in away_goal_list:
+            for goal_str in away_goal_ids:
                 await Goal.remove_goal_post(bot, goal_str, self.away_team, self)
+        Game._goal_signatures[self.game_id] = goal_signature
+        if 1 < home_diff <= 2 or 1 < away_diff <= 2:
+            return None
+        return team_data
 
-    async def save_game_state(self, bot: Red, time_to_game_start: str = "0") -> None:
+    async def save_game_state(
+        self,
+        bot: Red,
+        time_to_game_start: str = "0",
+        team_data: Optional[Dict[str, dict]] = None,
+    ) -> None:
         """
         Saves the data do the config to compare against new data
+
+        `team_data` is the result of `check_team_goals` when it has already been loaded
         """
-        home = await get_team(bot, self.home_team, self.game_start_str, self.game_id)
-        away = await get_team(bot, self.away_team, self.game_start_str, self.game_id)
+        if team_data is not None:
+            home, away = team_data[self.home_team], team_data[self.away_team]
+        else:
+            home, away = await get_teams(
+                bot, [self.home_team, self.away_team], self.game_start_str, self.game_id
+            )
         team_list = await bot.get_cog("Hockey").config.teams()
-        team_list.remove(home)
-        team_list.remove(away)
+        home_index = team_list.index(home)
+        away_index = team_list.index(away)
         if self.game_state != "Final":
             if self.game_state == "Preview" and time_to_game_start != "0":
                 home["game_state"] = self.game_state + time_to_game_start
@@ -1087,8 +1237,8 @@ class Game:
                 away["game_state"] = self.game_state
             home["period"] = self.period
             away["period"] = self.period
-            home["game_start"] = self.game_start.strftime("%Y-%m-%dT%H:%M:%SZ")
-            away["game_start"] = self.game_start.strftime("%Y-%m-%dT%H:%M:%SZ")
+            home["game_start"] = self.game_start_str
+            away["game_start"] = self.game_start_str
         else:
             if time_to_game_start == "0":
                 home["game_state"] = "Null"
@@ -1102,15 +1252,14 @@ class Game:
             elif self.game_state == "Final" and time_to_game_start != "0":
                 home["game_state"] = self.game_state + time_to_game_start
                 away["game_state"] = self.game_state + time_to_game_start
-        team_list.append(home)
-        team_list.append(away)
+        team_list[home_index] = home
+        team_list[away_index] = away
         await bot.get_cog("Hockey").config.teams.set(team_list)
 
     async def post_time_to_game_start(self, bot: Red, time_left: str) -> None:
         """
         Post when there is 60, 30, and 10 minutes until the game starts in all channels
         """
-        post_state = ["all", self.home_team, self.away_team]
         time_str = f"<t:{self.timestamp}:R>"
         msg = _("{away_emoji} {away} @ {home_emoji} {home} game starts {time}!").format(
             time=time_str,
@@ -1119,18 +1268,13 @@ class Game:
             home_emoji=self.home_emoji,
             home=self.home_team,
         )
-        tasks = []
-        all_channels = await bot.get_cog("Hockey").config.all_channels()
-        async for channel_id, data in AsyncIter(all_channels.items(), steps=100):
-            channel = await get_channel_obj(bot, channel_id, data)
-            if not channel:
-                continue
 
-            should_post = await check_to_post(bot, channel, data, post_state, self.game_state)
-            team_to_post = await bot.get_cog("Hockey").config.channel(channel).team()
-            if should_post and "all" not in team_to_post:
-                asyncio.create_task(self.post_game_start(channel, msg))
-        # await bounded_gather(*tasks)
+        def send(channel: discord.TextChannel, data: dict) -> Optional[Awaitable]:
+            if "all" in data["team"]:
+                return None
+            return self.post_game_start(channel, msg)
+
+        await self._broadcast(bot, send)
 
     async def post_game_start(self, channel: discord.TextChannel, msg: str) -> None:
         if not channel.permissions_for(channel.guild.me).send_messages:
@@ -1153,17 +1297,12 @@ class Game:
         cls, url: str, session: Optional[aiohttp.ClientSession] = None
     ) -> Optional[Game]:
         url = url.replace(BASE_URL, "")  # strip the base url incase we already have it
+        # pickems objects don't have access to the full cogs session
+        # so they fall back to the shared Game session
+        session = session or Game._get_session()
         try:
-            if session is None:
-                # this should only happen in pickems objects
-                # since pickems don't have access to the full
-                # cogs session
-                async with aiohttp.ClientSession() as new_session:
-                    async with new_session.get(BASE_URL + url) as resp:
-                        data = await resp.json()
-            else:
-                async with session.get(BASE_URL + url) as resp:
-                    data = await resp.json()
+            async with session.get(BASE_URL + url) as resp:
+                data = json_loads(await resp.read())
             return await cls.from_json(data)
         except Exception:
             log.exception("Error grabbing game data: ")
@@ -1182,11 +1321,17 @@ class Game:
         game_id = data["gameData"]["game"]["pk"]
         season = data["gameData"]["game"]["season"]
         period_starts = {}
-        for play in data["liveData"]["plays"]["allPlays"]:
-            if play["result"]["eventTypeId"] == "PERIOD_START":
-                dt = datetime.strptime(play["about"]["dateTime"], "%Y-%m-%dT%H:%M:%SZ")
-                dt = dt.replace(tzinfo=timezone.utc)
-                period_starts[play["about"]["ordinalNum"]] = dt
+        goal_plays = []
+        for play in event:
+            event_type = play["result"]["eventTypeId"]
+            if event_type == "PERIOD_START":
+                period_starts[play["about"]["ordinalNum"]] = parse_timestamp(
+                    play["about"]["dateTime"]
+                )
+            elif event_type == "GOAL" or (
+                event_type in ["SHOT", "MISSED_SHOT"] and play["about"]["ordinalNum"] == "SO"
+            ):
+                goal_plays.append(play)
 
         content = await Game.get_game_content(game_id)
         try:
@@ -1194,15 +1339,7 @@ class Game:
         except Exception:
             log.error("Cannot get game recap url.")
             recap_url = None
-        goals = [
-            await Goal.from_json(goal, players, content)
-            for goal in event
-            if goal["result"]["eventTypeId"] == "GOAL"
-            or (
-                goal["result"]["eventTypeId"] in ["SHOT", "MISSED_SHOT"]
-                and goal["about"]["ordinalNum"] == "SO"
-            )
-        ]
+        goals = [await Goal.from_json(goal, players, content) for goal in goal_plays]
         link = f"{BASE_URL}{data['link']}"
         if "currentPeriodOrdinal" in data["liveData"]["linescore"]:
             period_ord = data["liveData"]["linescore"]["currentPeriodOrdinal"]
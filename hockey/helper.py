@@ -73,6 +73,16 @@ def utc_to_local(utc_dt: datetime, new_timezone: str = "US/Pacific") -> datetime
     return utc_dt.replace(tzinfo=timezone.utc).astimezone(tz=eastern)
 
 
+def parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parses the ISO 8601 timestamps provided by the NHL API
+    into a timezone aware datetime
+    """
+    if timestamp.endswith("Z"):
+        return datetime.fromisoformat(timestamp[:-1]).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(timestamp)
+
+
 def get_chn_name(game: Game) -> str:
     """
     Creates game day channel name
@@ -117,8 +127,8 @@ class DateFinder(discord.app_commands.Transformer):
             return datetime.now(timezone.utc) + timedelta(days=1)
         find = DATE_RE.search(argument)
         if find:
-            date_str = f"{find.group(1)}-{find.group(3)}-{find.group(4)}"
-            return datetime.strptime(date_str, "%Y-%m-%d").astimezone(timezone.utc)
+            date = datetime(int(find.group(1)), int(find.group(3)), int(find.group(4)))
+            return date.astimezone(timezone.utc)
         else:
             raise BadArgument()
 
@@ -154,11 +164,12 @@ class TeamFinder(discord.app_commands.Transformer):
             # log.debug(pattern)
             reg: Pattern = re.compile(rf"\b{pattern}", flags=re.I)
             for pot in potential_teams:
-                find = reg.findall(pot)
+                find = reg.search(pot)
                 if find:
                     log.verbose("TeamFinder reg: %s", reg)
                     log.verbose("TeamFinder find: %s", find)
                     result.add(team)
+                    break
         if include_all and "all" in argument:
             result.add("all")
         if not result:
@@ -597,6 +608,35 @@ async def get_team(bot: Red, team: str, game_start: str, game_id: int = 0) -> di
     return return_team.to_json()
 
 
+async def get_teams(bot: Red, teams: List[str], game_start: str, game_id: int = 0) -> List[dict]:
+    """
+    Returns the saved entry for each team in `teams` like `get_team`
+    but only reads and writes the teams in config once
+    """
+    config = bot.get_cog("Hockey").config
+    team_list = await config.teams()
+    if team_list is None:
+        team_list = []
+    found = {}
+    for entry in team_list:
+        name = entry["team_name"]
+        if (
+            name in teams
+            and name not in found
+            and game_start == entry["game_start"]
+            and game_id == entry["game_id"]
+        ):
+            found[name] = entry
+    missing = [team for team in teams if team not in found]
+    if missing:
+        # Add unknown teams to the config to track stats
+        for team in missing:
+            found[team] = TeamEntry("Null", team, 0, [], {}, [], "", game_id).to_json()
+            team_list.append(found[team])
+        await config.teams.set(team_list)
+    return [found[team] for team in teams]
+
+
 async def get_channel_obj(
     bot: Red, channel_id: int, data: dict
 ) -> Optional[Union[discord.TextChannel, discord.Thread]]:
@@ -16,7 +16,7 @@ from redbot.core.utils import AsyncIter
 from .constants import BASE_URL, CONFIG_ID, CONTENT_URL, HEADSHOT_URL, TEAMS
 from .dev import HockeyDev
 from .errors import InvalidFileError
-from .game import Game
+from .game import Game, build_team_cache
 from .gamedaychannels import GameDayChannels
 from .gamedaythreads import GameDayThreads
 from .helper import utc_to_local
@@ -27,6 +27,11 @@ from .pickems import Pickems
 from .standings import Standings
 from .teamentry import TeamEntry
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 _ = Translator("Hockey", __file__)
 
 log = getLogger("red.trusty-cogs.Hockey")
@@ -179,6 +184,7 @@ class Hockey(
         if self.loop is not None:
             self.loop.cancel()
         await self.session.close()
+        await Game.close_session()
         self.pickems_loop.cancel()
         await self.after_pickems_loop()
 
@@ -457,7 +463,7 @@ class Hockey(
         if not self.TEST_LOOP:
             try:
                 async with self.session.get(BASE_URL + link) as resp:
-                    data = await resp.json()
+                    data = json_loads(await resp.read())
             except Exception:
                 log.exception("Error grabbing game data: ")
                 return None
@@ -513,6 +519,7 @@ class Hockey(
         # new_dict = {}
         for team in TEAMS:
             TEAMS[team]["emoji"] = data[team][0] if data[team][0] is not None else data["Other"][0]
+        build_team_cache()
         team_data = json.dumps(TEAMS, indent=4, sort_keys=True, separators=(",", " : "))
         constants_string = (
             f'BASE_URL = "{BASE_URL}"\n'
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import discord
 from red_commons.logging import getLogger
@@ -36,6 +38,23 @@ if TYPE_CHECKING:
 _ = Translator("Hockey", __file__)
 log = getLogger("red.trusty-cogs.hockey")
 
+# Number of player embeds kept by PlayerPages when flipping between players
+PLAYER_EMBED_CACHE_SIZE = 32
+
+# Discord allows up to 25 options in a select
+SELECT_WINDOW_HALF = 12
+
+
+def _select_window_start(page_number: int) -> int:
+    """
+    Returns the index of the first option in the select window centered on `page_number`
+    """
+    return max(0, page_number - SELECT_WINDOW_HALF)
+
+
+def _select_window(options: list, start: int) -> list:
+    return options[start : start + 2 * SELECT_WINDOW_HALF + 1]
+
 
 class GamesMenu(discord.ui.View):
     def __init__(
@@ -51,6 +70,7 @@ class GamesMenu(discord.ui.View):
         super().__init__(timeout=timeout)
         self.cog = cog
         self.source = source
+        self._has_select_options = hasattr(source, "select_options")
         self.message = message
         self.current_page = 0
         self.ctx: commands.Context = None
@@ -60,8 +80,8 @@ class GamesMenu(discord.ui.View):
         self.last_item = SkipForwardButton(discord.ButtonStyle.grey, 0)
         self.stop_button = StopButton(discord.ButtonStyle.red, 0)
         self.filter_button = FilterButton(discord.ButtonStyle.primary, 1)
-        self.heatmap_button = HeatmapButton(discord.ButtonStyle.primary, 1)
-        self.gameflow_button = GameflowButton(discord.ButtonStyle.primary, 1)
+        self.heatmap_button: Optional[HeatmapButton] = None
+        self.gameflow_button: Optional[GameflowButton] = None
         self.broadcast_button = BroadcastsButton(1)
         self.add_item(self.stop_button)
         self.add_item(self.first_item)
@@ -70,6 +90,8 @@ class GamesMenu(discord.ui.View):
         self.add_item(self.last_item)
         self.add_item(self.filter_button)
         if isinstance(self.source, Schedule):
+            self.heatmap_button = HeatmapButton(discord.ButtonStyle.primary, 1)
+            self.gameflow_button = GameflowButton(discord.ButtonStyle.primary, 1)
             self.heatmap_button.label = _("Heatmap {style}").format(style=self.source.style)
             corsi = "Corsi" if self.source.corsi else "Expected Goals"
             self.gameflow_button.label = _("Gameflow {corsi} {strength}").format(
@@ -81,21 +103,36 @@ class GamesMenu(discord.ui.View):
         if isinstance(self.source, ScheduleList):
             self.add_item(self.broadcast_button)
         self.select_view: Optional[HockeySelectGame] = None
+        # the options list and window start currently shown in select_view
+        self._select_window: Optional[Tuple[list, int]] = None
         self.author = None
+        self._author_id: Optional[int] = None
+        self._render_lock = asyncio.Lock()
+        self._pending_page: Optional[Tuple[int, Dict[str, Any]]] = None
+        # the source's team list, its length, and the humanized list for format_error
+        self._error_teams: Optional[Tuple[List[str], int, str]] = None
 
     async def on_timeout(self):
-        await self.message.edit(view=None)
+        if self.message is None:
+            return
+        try:
+            await self.message.edit(view=None)
+        except discord.HTTPException:
+            # The message may have been deleted or we lost permission to edit it
+            log.debug("Could not remove the view from the menu message", exc_info=True)
 
     async def start(self, ctx: commands.Context):
         await self.source._prepare_once()
-        if hasattr(self.source, "select_options") and len(self.source.select_options) > 1:
-            self.select_view = HockeySelectGame(self.source.select_options[:25])
+        if self._has_select_options and len(self.source.select_options) > 1:
+            self.select_view = HockeySelectGame(_select_window(self.source.select_options, 0))
+            self._select_window = (self.source.select_options, 0)
             self.add_item(self.select_view)
         self.ctx = ctx
         if isinstance(ctx, discord.Interaction):
             self.author = ctx.user
         else:
             self.author = ctx.author
+        self._author_id = self.author.id
         self.message = await self.send_initial_message(ctx)
 
     async def show_page(
@@ -106,6 +143,36 @@ class GamesMenu(discord.ui.View):
         skip_next: bool = False,
         skip_prev: bool = False,
         game_id: Optional[int] = None,
+    ) -> None:
+        kwargs = {
+            "interaction": interaction,
+            "skip_next": skip_next,
+            "skip_prev": skip_prev,
+            "game_id": game_id,
+        }
+        if self._render_lock.locked():
+            # Only render the latest page requested while another page is loading
+            self._pending_page = (page_number, kwargs)
+            await interaction.response.defer()
+            return
+        async with self._render_lock:
+            try:
+                await self._show_page(page_number, **kwargs)
+                while self._pending_page is not None:
+                    page_number, kwargs = self._pending_page
+                    self._pending_page = None
+                    await self._show_page(page_number, **kwargs)
+            finally:
+                self._pending_page = None
+
+    async def _show_page(
+        self,
+        page_number: int,
+        *,
+        interaction: discord.Interaction,
+        skip_next: bool = False,
+        skip_prev: bool = False,
+        game_id: Optional[int] = None,
     ) -> None:
         try:
             page = await self.source.get_page(
@@ -113,25 +180,29 @@ class GamesMenu(discord.ui.View):
             )
         except NoSchedule:
             if interaction.response.is_done():
-                await interaction.followup.edit(content=self.format_error(), embed=None, view=self)
+                await interaction.edit_original_response(
+                    content=self.format_error(), embed=None, view=self
+                )
             else:
                 await interaction.response.edit_message(
                     content=self.format_error(), embed=None, view=self
                 )
             return
-        if hasattr(self.source, "select_options") and len(self.source.select_options) > 1:
-            self.remove_item(self.select_view)
-            if page_number >= 12:
-                self.select_view = HockeySelectGame(
-                    self.source.select_options[page_number - 12 : page_number + 13]
-                )
-            else:
-                self.select_view = HockeySelectGame(self.source.select_options[:25])
-            self.add_item(self.select_view)
+        if self._has_select_options and len(self.source.select_options) > 1:
+            all_options = self.source.select_options
+            start = _select_window_start(page_number)
+            if self.select_view is None:
+                self.select_view = HockeySelectGame(_select_window(all_options, start))
+                self.add_item(self.select_view)
+            elif self._select_window is None or (
+                self._select_window[0] is not all_options or self._select_window[1] != start
+            ):
+                self.select_view.options = _select_window(all_options, start)
+            self._select_window = (all_options, start)
         self.current_page = page_number
         kwargs = await self._get_kwargs_from_page(page)
         if interaction.response.is_done():
-            await interaction.followup.edit(**kwargs, view=self)
+            await interaction.edit_original_response(**kwargs, view=self)
         else:
             await interaction.response.edit_message(**kwargs, view=self)
 
@@ -151,6 +222,7 @@ class GamesMenu(discord.ui.View):
         This implementation shows the first page of the source.
         """
         self.author = ctx.author
+        self._author_id = self.author.id
 
         try:
             page = await self.source.get_page(0)
@@ -162,8 +234,12 @@ class GamesMenu(discord.ui.View):
 
     def format_error(self):
         team = ""
-        if self.source.team:
-            team = _("for {teams} ").format(teams=humanize_list(self.source.team))
+        teams = self.source.team
+        if teams:
+            cached = self._error_teams
+            if cached is None or cached[0] is not teams or cached[1] != len(teams):
+                self._error_teams = cached = (teams, len(teams), humanize_list(teams))
+            team = _("for {teams} ").format(teams=cached[2])
         msg = _("No schedule could be found {team}in dates between {last_searched}").format(
             team=team, last_searched=self.source._last_searched
         )
@@ -178,35 +254,34 @@ class GamesMenu(discord.ui.View):
 
     async def interaction_check(self, interaction: discord.Interaction):
         """Just extends the default reaction_check to use owner_ids"""
-        if self.author and interaction.user.id != self.author.id:
-            await interaction.response.send_message(
-                content=_("You are not authorized to interact with this."), ephemeral=True
-            )
-            return False
-        return True
+        if self._author_id is None or interaction.user.id == self._author_id:
+            return True
+        await interaction.response.send_message(
+            content=_("You are not authorized to interact with this."), ephemeral=True
+        )
+        return False
 
 
 class LeaderboardPages(menus.ListPageSource):
     def __init__(self, pages: list, style: LeaderboardType):
         super().__init__(pages, per_page=1)
         self.style = style
+        self._author_suffix = _(" Pickems {style} Leaderboard").format(
+            style=style.as_str().title()
+        )
 
     def is_paginating(self) -> bool:
         return True
 
     async def format_page(self, view: BaseMenu, page: List[str]) -> discord.Embed:
         em = discord.Embed(timestamp=datetime.now())
-        description = ""
-        for msg in page:
-            description += msg
-        em.description = description
+        em.description = "".join(page)
         em.set_author(
-            name=view.ctx.guild.name
-            + _(" Pickems {style} Leaderboard").format(style=self.style.as_str().title()),
+            name=view.ctx.guild.name + self._author_suffix,
             icon_url=view.ctx.guild.icon,
         )
         em.set_thumbnail(url=view.ctx.guild.icon)
-        em.set_footer(text=f"Page {view.current_page + 1}/{self.get_max_pages()}")
+        em.set_footer(text="Page %d/%d" % (view.current_page + 1, self.get_max_pages()))
         return em
 
 
@@ -216,6 +291,8 @@ class PlayerPages(menus.ListPageSource):
         self.pages: List[int] = pages
         self.players = {p.id: p for p in pages}
         self.season: str = season
+        # (player id, season): embed of the most recently viewed players
+        self._embeds: OrderedDict[Tuple[int, str], discord.Embed] = OrderedDict()
         self.select_options = []
         for count, player in enumerate(pages):
             player_name = player.full_name
@@ -233,9 +310,17 @@ class PlayerPages(menus.ListPageSource):
     async def format_page(self, view: BaseMenu, player: SimplePlayer) -> discord.Embed:
         # player = await Player.from_id(page, session=view.cog.session)
         log.trace("PlayerPages player: %s", player)
-        player = await player.get_full_stats(self.season, session=view.cog.session)
-        em = player.get_embed()
-        em.set_footer(text=f"Page {view.current_page + 1}/{self.get_max_pages()}")
+        key = (player.id, self.season)
+        em = self._embeds.get(key)
+        if em is None:
+            player = await player.get_full_stats(self.season, session=view.cog.session)
+            em = player.get_embed()
+            self._embeds[key] = em
+            if len(self._embeds) > PLAYER_EMBED_CACHE_SIZE:
+                self._embeds.popitem(last=False)
+        else:
+            self._embeds.move_to_end(key)
+        em.set_footer(text="Page %d/%d" % (view.current_page + 1, self.get_max_pages()))
         return em
 
 
@@ -248,7 +333,7 @@ class SimplePages(menus.ListPageSource):
 
     async def format_page(self, view: BaseMenu, page: Any) -> Union[discord.Embed, str]:
         if isinstance(page, discord.Embed):
-            page.set_footer(text=f"Page {view.current_page + 1}/{self.get_max_pages()}")
+            page.set_footer(text="Page %d/%d" % (view.current_page + 1, self.get_max_pages()))
         return page
 
 
@@ -267,6 +352,7 @@ class BaseMenu(discord.ui.View):
         super().__init__(timeout=timeout)
         self.cog: HockeyMixin = cog
         self._source = source
+        self._has_select_options = hasattr(source, "select_options")
         self.ctx: commands.Context = None
         self.message: discord.Message = None
         self.page_start = page_start
@@ -282,17 +368,29 @@ class BaseMenu(discord.ui.View):
         self.add_item(self.forward_button)
         self.add_item(self.last_item)
         self.select_view = None
-        if hasattr(self.source, "select_options"):
-            self.select_view = HockeySelectPlayer(self.source.select_options[:25])
+        # the options list and window start currently shown in select_view
+        self._select_window: Optional[Tuple[list, int]] = None
+        if self._has_select_options:
+            self.select_view = HockeySelectPlayer(_select_window(self.source.select_options, 0))
+            self._select_window = (self.source.select_options, 0)
             self.add_item(self.select_view)
         self.author = None
+        self._author_id: Optional[int] = None
+        self._render_lock = asyncio.Lock()
+        self._pending_page: Optional[Tuple[int, discord.Interaction]] = None
 
     @property
     def source(self):
         return self._source
 
     async def on_timeout(self):
-        await self.message.edit(view=None)
+        if self.message is None:
+            return
+        try:
+            await self.message.edit(view=None)
+        except discord.HTTPException:
+            # The message may have been deleted or we lost permission to edit it
+            log.debug("Could not remove the view from the menu message", exc_info=True)
 
     async def start(
         self, ctx: commands.Context, content: Optional[str] = None, ephemeral: bool = False
@@ -311,23 +409,42 @@ class BaseMenu(discord.ui.View):
             return {"embed": value, "content": None}
 
     async def update_select_view(self, page_number: int):
-        if self.select_view is not None:
-            self.remove_item(self.select_view)
-        if not hasattr(self.source, "select_options"):
+        if not self._has_select_options:
             return
-        options = self.source.select_options[:25]
-        if page_number >= 12:
-            options = self.source.select_options[page_number - 12 : page_number + 13]
-        self.select_view = HockeySelectPlayer(options)
-        self.add_item(self.select_view)
+        all_options = self.source.select_options
+        start = _select_window_start(page_number)
+        if self.select_view is None:
+            self.select_view = HockeySelectPlayer(_select_window(all_options, start))
+            self.add_item(self.select_view)
+        elif self._select_window is None or (
+            self._select_window[0] is not all_options or self._select_window[1] != start
+        ):
+            self.select_view.options = _select_window(all_options, start)
+        self._select_window = (all_options, start)
 
     async def show_page(self, page_number: int, interaction: discord.Interaction):
+        if self._render_lock.locked():
+            # Only render the latest page requested while another page is loading
+            self._pending_page = (page_number, interaction)
+            await interaction.response.defer()
+            return
+        async with self._render_lock:
+            try:
+                await self._show_page(page_number, interaction)
+                while self._pending_page is not None:
+                    page_number, interaction = self._pending_page
+                    self._pending_page = None
+                    await self._show_page(page_number, interaction)
+            finally:
+                self._pending_page = None
+
+    async def _show_page(self, page_number: int, interaction: discord.Interaction):
         page = await self._source.get_page(page_number)
         self.current_page = page_number
         kwargs = await self._get_kwargs_from_page(page)
         await self.update_select_view(page_number)
         if interaction.response.is_done():
-            await interaction.followup.edit(**kwargs, view=self)
+            await interaction.edit_original_response(**kwargs, view=self)
         else:
             await interaction.response.edit_message(**kwargs, view=self)
 
@@ -344,6 +461,7 @@ class BaseMenu(discord.ui.View):
         if content and not kwargs.get("content", None):
             kwargs["content"] = content
         self.author = ctx.author
+        self._author_id = self.author.id
         return await ctx.send(**kwargs, view=self, ephemeral=ephemeral)
 
     async def show_checked_page(self, page_number: int, interaction: discord.Interaction) -> None:
@@ -364,9 +482,9 @@ class BaseMenu(discord.ui.View):
 
     async def interaction_check(self, interaction: discord.Interaction):
         """Just extends the default reaction_check to use owner_ids"""
-        if self.author and interaction.user.id != self.author.id:
-            await interaction.response.send_message(
-                content=_("You are not authorized to interact with this."), ephemeral=True
-            )
-            return False
-        return True
+        if self._author_id is None or interaction.user.id == self._author_id:
+            return True
+        await interaction.response.send_message(
+            content=_("You are not authorized to interact with this."), ephemeral=True
+        )
+        return False
@@ -2,10 +2,22 @@ from __future__ import annotations
 
 import asyncio
 import re
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, Literal, NamedTuple, Optional, Union
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import aiohttp
 import discord
@@ -250,10 +262,36 @@ class Playoffs:
     defaultRound: int
     rounds: List[Round]
 
+    _cache: ClassVar[Optional[Tuple[float, Playoffs]]] = None
+
     @classmethod
     def from_json(cls, data: dict) -> Playoffs:
         return cls(**data)
 
+    @cached_property
+    def by_team_name(self) -> Dict[str, Tuple[Round, Series, TeamMatchup]]:
+        """
+        Maps each team name to its latest round, series and matchup
+        """
+        ret = {}
+        for rounds in self.rounds:
+            for series in rounds.series:
+                for matchup in series.matchupTeams:
+                    ret[matchup.team.name] = (rounds, series, matchup)
+        return ret
+
+    @classmethod
+    async def get_playoffs_cached(
+        cls, ttl: int = 300, session: Optional[aiohttp.ClientSession] = None
+    ) -> Playoffs:
+        """
+        Returns the current playoffs reusing the last response for `ttl` seconds
+        """
+        now = time.monotonic()
+        if cls._cache is None or now - cls._cache[0] > ttl:
+            cls._cache = (now, await cls.get_playoffs(session=session))
+        return cls._cache[1]
+
     @classmethod
     async def get_playoffs(
         cls, season: Optional[str] = None, session: Optional[aiohttp.ClientSession] = None
@@ -467,6 +505,8 @@ class TeamRecord:
 
 
 class Standings:
+    _cache: Optional[Tuple[float, Standings]] = None
+
     def __init__(self, records: dict = {}):
         super().__init__()
         self.all_records = records
@@ -517,6 +557,18 @@ class Standings:
                 all_records[record.team.name] = record
         return cls(records=all_records)
 
+    @classmethod
+    async def get_team_standings_cached(
+        cls, ttl: int = 300, session: Optional[aiohttp.ClientSession] = None
+    ) -> Standings:
+        """
+        Returns the current standings reusing the last response for `ttl` seconds
+        """
+        now = time.monotonic()
+        if cls._cache is None or now - cls._cache[0] > ttl:
+            cls._cache = (now, await cls.get_team_standings(session=session))
+        return cls._cache[1]
+
     @staticmethod
     async def post_automatic_standings(bot) -> None:
         """